@@ -6,16 +6,29 @@ This provides a user-friendly CLI for Route 53 DNS management operations.
 """
 
 import argparse
+import shlex
 import sys
+import time
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
-from src.route53_client import Route53Client
-from src.route53_operations import Route53Operations
-from src.session_manager import SessionManager
 from src.utils.error_handling import Route53Error
 from src.utils.logging import setup_logger
 
+if TYPE_CHECKING:
+    from src.route53_operations import Route53Operations
+
 
 def setup_cli_logging(verbose: bool = False) -> None:
     """Set up logging for CLI operations."""
@@ -24,122 +37,325 @@ def setup_cli_logging(verbose: bool = False) -> None:
     setup_logger("cli", level=level, log_file=log_file)
 
 
+@lru_cache(maxsize=4)
 def create_operations(
     profile: Optional[str] = None, region: str = "us-east-1"
-) -> Route53Operations:
-    """Create and return a Route53Operations instance."""
+) -> "Route53Operations":
+    """
+    Create and return a Route53Operations instance.
+
+    Instances are cached per (profile, region), so repeated commands in one
+    process reuse the same session and client.
+    """
+    # Imported here so that `--help` and argument errors never load boto3
+    from src.route53_operations import Route53Operations
+    from src.session_manager import SessionManager
+
     session_manager = SessionManager(profile_name=profile, region_name=region)
-    session = session_manager.get_session()
+    return Route53Operations(session_manager.get_route53_client())
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    """Format one resource record set as a `list-records` output line."""
+    get = record.get
+    record_type = get("Type", "Unknown")
+    name = get("Name", "Unknown")
+
+    if "ResourceRecords" in record:
+        value_str = ", ".join(rr["Value"] for rr in record["ResourceRecords"])
+    elif "AliasTarget" in record:
+        value_str = f"ALIAS -> {record['AliasTarget'].get('DNSName', 'Unknown')}"
+    else:
+        value_str = "No value found"
+
+    return f"  {record_type:<6} {name:<40} {value_str}"
+
+
+def format_records_by_zone(records_by_zone: Dict[str, List[Dict[str, Any]]]) -> str:
+    """Format the records of several zones as `list-records-multi` output."""
+    lines = []
+    for zone_id, records in records_by_zone.items():
+        lines.append(f"Found {len(records)} records in zone {zone_id}:")
+        lines.extend(map(format_record, records))
+    return "\n".join(lines) + "\n"
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
 
-    route53_client = Route53Client(session)
-    client = route53_client.get_client()
+def _handle_cli_errors(func: F) -> F:
+    """
+    Decorator that reports Route53Error to stderr and exits with status 1.
 
-    return Route53Operations(client)
+    Args:
+        func: The command handler to wrap.
 
+    Returns:
+        The wrapped command handler.
+    """
 
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except Route53Error as e:
+            sys.stderr.write(f"Error: {e}\n")
+            sys.exit(1)
+
+    return cast(F, wrapper)
+
+
+@_handle_cli_errors
 def cmd_list_records(args: argparse.Namespace) -> None:
     """List records in a hosted zone."""
-    try:
-        operations = create_operations(args.profile, args.region)
-        records = operations.list_records(args.zone_id)
-
-        print(f"Found {len(records)} records in zone {args.zone_id}:")
-        for record in records:
-            record_type = record.get("Type", "Unknown")
-            name = record.get("Name", "Unknown")
-
-            if "ResourceRecords" in record:
-                values = [rr["Value"] for rr in record["ResourceRecords"]]
-                value_str = ", ".join(values)
-            elif "AliasTarget" in record:
-                value_str = (
-                    f"ALIAS -> {record['AliasTarget'].get('DNSName', 'Unknown')}"
-                )
-            else:
-                value_str = "No value found"
-
-            print(f"  {record_type:<6} {name:<40} {value_str}")
-
-    except Route53Error as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    operations = create_operations(args.profile, args.region)
+
+    # Each page is printed as it arrives, so the count can only follow it
+    count = 0
+    for count, record in enumerate(operations.iter_records(args.zone_id), 1):
+        sys.stdout.write(format_record(record) + "\n")
+    sys.stdout.write(f"Found {count} records in zone {args.zone_id}\n")
+
 
+@_handle_cli_errors
+def cmd_list_records_multi(args: argparse.Namespace) -> None:
+    """List records in several hosted zones concurrently."""
+    operations = create_operations(args.profile, args.region)
+    records_by_zone = operations.list_records_many(args.zone_ids)
 
+    sys.stdout.write(format_records_by_zone(records_by_zone))
+
+
+@_handle_cli_errors
 def cmd_create_record(args: argparse.Namespace) -> None:
     """Create DNS records."""
-    try:
-        operations = create_operations(args.profile, args.region)
-        change_id = operations.create_dns_record(
-            hosted_zone_id=args.zone_id,
-            domain=args.domain,
-            load_balancer_ip=args.ip,
-            services=args.services,
-        )
-
-        print("Created DNS records successfully!")
-        print(f"   Zone ID: {args.zone_id}")
-        print(f"   Domain: {args.domain}")
-        print(f"   IP: {args.ip}")
-        print(f"   Services: {', '.join(args.services)}")
-        print(f"   Change ID: {change_id}")
-
-    except Route53Error as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    operations = create_operations(args.profile, args.region)
+    change_id = operations.create_dns_record(
+        hosted_zone_id=args.zone_id,
+        domain=args.domain,
+        load_balancer_ip=args.ip,
+        services=args.services,
+    )
+
+    sys.stdout.write(
+        "Created DNS records successfully!\n"
+        f"   Zone ID: {args.zone_id}\n"
+        f"   Domain: {args.domain}\n"
+        f"   IP: {args.ip}\n"
+        f"   Services: {', '.join(args.services)}\n"
+        f"   Change ID: {change_id}\n"
+    )
 
 
+@_handle_cli_errors
 def cmd_delete_records(args: argparse.Namespace) -> None:
     """Delete DNS records."""
-    try:
-        operations = create_operations(args.profile, args.region)
-        change_id = operations.delete_dns_records(
-            hosted_zone_id=args.zone_id,
-            domain=args.domain,
-            services=args.services,
-        )
-
-        print("✅ Deleted DNS records successfully!")
-        print(f"   Zone ID: {args.zone_id}")
-        print(f"   Domain: {args.domain}")
-        print(f"   Services: {', '.join(args.services)}")
-        print(f"   Change ID: {change_id}")
-
-    except Route53Error as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    operations = create_operations(args.profile, args.region)
+    change_id = operations.delete_dns_records(
+        hosted_zone_id=args.zone_id,
+        domain=args.domain,
+        services=args.services,
+    )
+
+    sys.stdout.write(
+        "✅ Deleted DNS records successfully!\n"
+        f"   Zone ID: {args.zone_id}\n"
+        f"   Domain: {args.domain}\n"
+        f"   Services: {', '.join(args.services)}\n"
+        f"   Change ID: {change_id}\n"
+    )
 
 
+@_handle_cli_errors
 def cmd_check_change(args: argparse.Namespace) -> None:
     """Check the status of a change."""
-    try:
-        operations = create_operations(args.profile, args.region)
-        status = operations.get_change_status(args.change_id)
-
-        print(f"Change {args.change_id} status: {status}")
-
-        if status == "INSYNC":
-            print("✅ Change has been propagated successfully!")
-        elif status == "PENDING":
-            print("⏳ Change is still propagating...")
-        else:
-            print(f"❓ Unknown status: {status}")
-
-    except Route53Error as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-
-def main() -> None:
-    """Main CLI entry point."""
+    operations = create_operations(args.profile, args.region)
+    status = operations.get_change_status(args.change_id)
+
+    if status == "INSYNC":
+        summary = "✅ Change has been propagated successfully!"
+    elif status == "PENDING":
+        summary = "⏳ Change is still propagating..."
+    else:
+        summary = f"❓ Unknown status: {status}"
+
+    sys.stdout.write(f"Change {args.change_id} status: {status}\n{summary}\n")
+
+
+# Seconds between polling rounds of `check-changes --wait`
+CHANGE_POLL_INTERVAL = 2
+
+
+@_handle_cli_errors
+def cmd_check_changes(args: argparse.Namespace) -> None:
+    """Check the status of several changes concurrently."""
+    operations = create_operations(args.profile, args.region)
+    pending = list(dict.fromkeys(args.change_ids))
+
+    while True:
+        still_pending = []
+        for change_id, status in operations.iter_change_statuses(pending):
+            sys.stdout.write(f"Change {change_id} status: {status}\n")
+            if status != "INSYNC":
+                still_pending.append(change_id)
+
+        if not (args.wait and still_pending):
+            break
+        pending = still_pending
+        time.sleep(CHANGE_POLL_INTERVAL)
+
+    if still_pending:
+        sys.stdout.write(f"⏳ {len(still_pending)} change(s) still propagating...\n")
+    else:
+        sys.stdout.write("✅ All changes have been propagated successfully!\n")
+
+
+def run_repl(args: argparse.Namespace) -> None:
+    """Run commands interactively, reusing one session and client."""
+    prog = "route53"
+
+    # Warm the cached client once so every command below reuses it
+    create_operations(args.profile, args.region)
+    print("Route 53 shell - type a command, 'help' for commands, 'exit' to quit")
+
+    while True:
+        try:
+            line = input(f"{prog}> ")
+        except (EOFError, KeyboardInterrupt):
+            # Ctrl-D or Ctrl-C at the prompt leaves the shell like 'exit'
+            print()
+            break
+
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            continue
+
+        if not argv:
+            continue
+        name, command_args = argv[0], argv[1:]
+        if name in ("exit", "quit"):
+            break
+        if name != "help" and (name not in _COMMANDS or name == "shell"):
+            print(f"Unknown command: {name}", file=sys.stderr)
+            name = "help"
+        if name == "help":
+            print("Commands: " + ", ".join(c for c in _COMMANDS if c != "shell"))
+            continue
+
+        # argparse errors and failing commands exit; keep the shell alive.
+        # Only the global options carry over: argparse leaves attributes
+        # already on the namespace alone, so a copied func would rerun
+        # the shell instead of the command.
+        try:
+            command = _build_command_parser(prog, name).parse_args(
+                command_args,
+                namespace=argparse.Namespace(
+                    profile=args.profile, region=args.region, verbose=args.verbose
+                ),
+            )
+            command.func(command)
+        except SystemExit:
+            pass
+
+
+def _build_list_records_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("zone_id", help="Hosted zone ID")
+    parser.set_defaults(func=cmd_list_records)
+
+
+def _build_list_records_multi_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("zone_ids", nargs="+", help="Hosted zone IDs")
+    parser.set_defaults(func=cmd_list_records_multi)
+
+
+def _build_create_record_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("zone_id", help="Hosted zone ID")
+    parser.add_argument("domain", help="Domain name (e.g., example.com)")
+    parser.add_argument("ip", help="IP address for the records")
+    parser.add_argument("services", nargs="+", help="Service names (e.g., api web)")
+    parser.set_defaults(func=cmd_create_record)
+
+
+def _build_delete_records_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("zone_id", help="Hosted zone ID")
+    parser.add_argument("domain", help="Domain name (e.g., example.com)")
+    parser.add_argument("services", nargs="+", help="Service names (e.g., api web)")
+    parser.set_defaults(func=cmd_delete_records)
+
+
+def _build_check_change_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("change_id", help="Change ID to check")
+    parser.set_defaults(func=cmd_check_change)
+
+
+def _build_check_changes_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("change_ids", nargs="+", help="Change IDs to check")
+    parser.add_argument(
+        "--wait", action="store_true", help="Keep polling until all are INSYNC"
+    )
+    parser.set_defaults(func=cmd_check_changes)
+
+
+def _build_shell_parser(parser: argparse.ArgumentParser) -> None:
+    parser.set_defaults(func=run_repl)
+
+
+# Subcommand name -> (help text, parser builder). Builders only run for the
+# command actually selected, so unused subcommands cost nothing.
+_COMMANDS: Dict[str, Tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "list-records": ("List records in a hosted zone", _build_list_records_parser),
+    "list-records-multi": (
+        "List records in several hosted zones",
+        _build_list_records_multi_parser,
+    ),
+    "create-record": ("Create DNS records", _build_create_record_parser),
+    "delete-records": ("Delete DNS records", _build_delete_records_parser),
+    "check-change": ("Check change status", _build_check_change_parser),
+    "check-changes": (
+        "Check the status of several changes",
+        _build_check_changes_parser,
+    ),
+    "shell": ("Start an interactive shell", _build_shell_parser),
+}
+
+
+@lru_cache(maxsize=None)
+def _build_command_parser(prog: str, command: str) -> argparse.ArgumentParser:
+    """Build the argument parser for a single subcommand, once per process."""
+    help_text, build_parser = _COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f"{prog} {command}", description=help_text)
+    build_parser(parser)
+    return parser
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Return the top-level argument parser, building it on first use.
+
+    Like the subcommand parsers, it is cached so that repeated calls to
+    main() (tests, embedding) do not rebuild it.
+    """
+    commands_help = "\n".join(
+        f"  {name:<20}{help_text}" for name, (help_text, _) in _COMMANDS.items()
+    )
     parser = argparse.ArgumentParser(
         description="Route 53 DNS automation tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+        epilog=f"""
+Commands:
+{commands_help}
+
 Examples:
   %(prog)s list-records Z1234567890
+  %(prog)s list-records-multi Z1234567890 Z0987654321
   %(prog)s create-record Z1234567890 example.com 10.0.0.100 api web
   %(prog)s delete-records Z1234567890 example.com api web
   %(prog)s check-change /change/C123456789
+  %(prog)s check-changes --wait /change/C123456789 /change/C987654321
+  %(prog)s --profile prod shell
         """,
     )
 
@@ -148,46 +364,38 @@ Examples:
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # List records command
-    list_parser = subparsers.add_parser(
-        "list-records", help="List records in a hosted zone"
-    )
-    list_parser.add_argument("zone_id", help="Hosted zone ID")
-    list_parser.set_defaults(func=cmd_list_records)
-
-    # Create record command
-    create_parser = subparsers.add_parser("create-record", help="Create DNS records")
-    create_parser.add_argument("zone_id", help="Hosted zone ID")
-    create_parser.add_argument("domain", help="Domain name (e.g., example.com)")
-    create_parser.add_argument("ip", help="IP address for the records")
-    create_parser.add_argument(
-        "services", nargs="+", help="Service names (e.g., api web)"
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=_COMMANDS,
+        metavar="command",
+        help="Command to run (see below)",
     )
-    create_parser.set_defaults(func=cmd_create_record)
-
-    # Delete records command
-    delete_parser = subparsers.add_parser("delete-records", help="Delete DNS records")
-    delete_parser.add_argument("zone_id", help="Hosted zone ID")
-    delete_parser.add_argument("domain", help="Domain name (e.g., example.com)")
-    delete_parser.add_argument(
-        "services", nargs="+", help="Service names (e.g., api web)"
+    parser.add_argument(
+        "command_args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS
     )
-    delete_parser.set_defaults(func=cmd_delete_records)
 
-    # Check change command
-    check_parser = subparsers.add_parser("check-change", help="Check change status")
-    check_parser.add_argument("change_id", help="Change ID to check")
-    check_parser.set_defaults(func=cmd_check_change)
+    return parser
+
 
-    args = parser.parse_args()
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main CLI entry point.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:]).
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    # Build only the selected subcommand's parser
+    command_parser = _build_command_parser(parser.prog, args.command)
+    command_parser.parse_args(args.command_args, namespace=args)
+
     # Set up logging
     setup_cli_logging(args.verbose)
 
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Command Line Interface for boto3-r53-automations.
+
+Independent Route 53 calls (checking several changes, listing several
+zones) are issued concurrently with aioboto3 instead of one after another.
+Every call still takes a token from the shared "route53" rate limiter, so
+the concurrency never exceeds the request rate Route 53 allows.
+aioboto3 is an optional dependency: ``pip install boto3-r53-automations[async]``.
+"""
+
+import argparse
+import asyncio
+import sys
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from cli import format_records_by_zone, setup_cli_logging
+from src.route53_operations import MAX_CONCURRENT_REQUESTS
+from src.utils.error_handling import Route53Error, validate_hosted_zone_id
+from src.utils.rate_limiter import RateLimiter, get_rate_limiter
+
+T = TypeVar("T")
+
+# Longest wait for a rate limiter token, in seconds, before a call is rejected
+RATE_LIMIT_TIMEOUT = 30.0
+
+
+def _create_session(profile: Optional[str], region: str) -> Any:
+    """Create an aioboto3 session, explaining how to install it if missing."""
+    try:
+        import aioboto3
+    except ImportError:
+        print(
+            "Error: the async CLI requires aioboto3 "
+            "(pip install boto3-r53-automations[async])",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return aioboto3.Session(profile_name=profile, region_name=region)
+
+
+async def _acquire_token() -> None:
+    """
+    Take a token from the shared Route 53 bucket without blocking the loop.
+
+    The wait runs in a worker thread, so the synchronous and async CLIs draw
+    from the same RateLimiter and are paced the same way.
+
+    Raises:
+        TimeoutError: If no token became available within RATE_LIMIT_TIMEOUT.
+    """
+    bucket = get_rate_limiter("route53")
+    if isinstance(bucket, RateLimiter) and not await asyncio.to_thread(
+        bucket.wait_for_tokens, timeout=RATE_LIMIT_TIMEOUT
+    ):
+        raise TimeoutError("Rate limiter timeout")
+
+
+async def _gather_paced(calls: List[Callable[[], Awaitable[T]]]) -> List[T]:
+    """
+    Run the calls concurrently, paced by the shared rate limiter.
+
+    At most MAX_CONCURRENT_REQUESTS calls are in flight at once, and each
+    takes a rate limiter token before it starts.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def paced(call: Callable[[], Awaitable[T]]) -> T:
+        async with semaphore:
+            await _acquire_token()
+            return await call()
+
+    return await asyncio.gather(*(paced(call) for call in calls))
+
+
+async def check_changes(client: Any, change_ids: List[str]) -> Dict[str, str]:
+    """
+    Get the status of several Route 53 changes concurrently.
+
+    Args:
+        client: An aioboto3 Route 53 client.
+        change_ids: IDs of the changes to check.
+
+    Returns:
+        Mapping of change ID to status (e.g., 'PENDING', 'INSYNC').
+    """
+    responses = await _gather_paced(
+        [partial(client.get_change, Id=change_id) for change_id in change_ids]
+    )
+    return {
+        change_id: response["ChangeInfo"]["Status"]
+        for change_id, response in zip(change_ids, responses)
+    }
+
+
+async def list_records_many(
+    client: Any, hosted_zone_ids: List[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    List the records of several hosted zones concurrently.
+
+    Args:
+        client: An aioboto3 Route 53 client.
+        hosted_zone_ids: IDs of the Route 53 hosted zones.
+
+    Returns:
+        Mapping of each hosted zone ID to its resource record sets.
+    """
+
+    async def list_zone(hosted_zone_id: str) -> List[Dict[str, Any]]:
+        paginator = client.get_paginator("list_resource_record_sets")
+        pages = aiter(paginator.paginate(HostedZoneId=hosted_zone_id))
+        records: List[Dict[str, Any]] = []
+        # Each page is its own API call, so each takes its own token; the
+        # first was taken by _gather_paced
+        while (page := await anext(pages, None)) is not None:
+            records.extend(page.get("ResourceRecordSets", []))
+            if page.get("IsTruncated"):
+                await _acquire_token()
+        return records
+
+    zone_ids = [validate_hosted_zone_id(zone_id) for zone_id in hosted_zone_ids]
+    results = await _gather_paced([partial(list_zone, zone_id) for zone_id in zone_ids])
+    return dict(zip(hosted_zone_ids, results))
+
+
+async def cmd_check_changes(args: argparse.Namespace) -> None:
+    """Check the status of several changes."""
+    session = _create_session(args.profile, args.region)
+    async with session.client("route53") as client:
+        statuses = await check_changes(client, args.change_ids)
+
+    sys.stdout.write(
+        "".join(
+            f"Change {change_id} status: {status}\n"
+            for change_id, status in statuses.items()
+        )
+    )
+
+
+async def cmd_list_records_multi(args: argparse.Namespace) -> None:
+    """List records in several hosted zones."""
+    session = _create_session(args.profile, args.region)
+    async with session.client("route53") as client:
+        records_by_zone = await list_records_many(client, args.zone_ids)
+
+    sys.stdout.write(format_records_by_zone(records_by_zone))
+
+
+def main() -> None:
+    """Async CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Route 53 DNS automation tool (concurrent operations)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s check-changes /change/C123456789 /change/C987654321
+  %(prog)s list-records-multi Z1234567890 Z0987654321
+        """,
+    )
+
+    parser.add_argument("--profile", help="AWS profile to use", default=None)
+    parser.add_argument("--region", help="AWS region", default="us-east-1")
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Enable verbose logging"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    check_parser = subparsers.add_parser(
+        "check-changes", help="Check the status of several changes"
+    )
+    check_parser.add_argument("change_ids", nargs="+", help="Change IDs to check")
+    check_parser.set_defaults(func=cmd_check_changes)
+
+    list_parser = subparsers.add_parser(
+        "list-records-multi", help="List records in several hosted zones"
+    )
+    list_parser.add_argument("zone_ids", nargs="+", help="Hosted zone IDs")
+    list_parser.set_defaults(func=cmd_list_records_multi)
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    setup_cli_logging(args.verbose)
+
+    try:
+        asyncio.run(args.func(args))
+    except (ClientError, BotoCoreError, Route53Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
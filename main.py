@@ -1,4 +1,3 @@
-<<<<<<< feature/production-ready-improvements
 #!/usr/bin/env python3
 """
 Main entry point for boto3-r53-automations.
@@ -10,7 +9,6 @@ with proper logging, error handling, and rate limiting.
 from pathlib import Path
 
 from src.route53_client import Route53Client
-from src.route53_operations import Route53Operations
 from src.session_manager import SessionManager
 from src.utils.logging import setup_logger
 
@@ -36,17 +34,12 @@ def main() -> None:
 
         # Initialize Route 53 client
         logger.info("Initializing Route 53 client...")
-        route53_client = Route53Client(session)
-        client = route53_client.get_client()
+        route53_client = Route53Client(session, config=session_manager.client_config)
 
         # Display client info
         client_info = route53_client.get_client_info()
         logger.info(f"Route 53 client info: {client_info}")
 
-        # Initialize Route 53 operations
-        logger.info("Initializing Route 53 operations...")
-        operations = Route53Operations(client)
-
         logger.info(
             "Route 53 automation tool initialized successfully! "
             "Ready for DNS management operations."
@@ -55,6 +48,8 @@ def main() -> None:
         # Example of how the tool would be used (commented out for safety)
         logger.info(
             "Example usage (commented out for safety):\n"
+            "# operations = Route53Operations(route53_client.get_client())\n"
+            "# \n"
             "# Create DNS records:\n"
             "# change_id = operations.create_dns_record(\n"
             "#     hosted_zone_id='Z1234567890',\n"
@@ -76,10 +71,6 @@ def main() -> None:
         return
 
     logger.info("Route 53 automation tool demonstration completed successfully!")
-=======
-def main():
-    print("Hello from aws-boto3-modules!")
->>>>>>> main
 
 
 if __name__ == "__main__":
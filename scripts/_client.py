@@ -0,0 +1,13 @@
+from typing import Any, Optional
+
+from src.session_manager import SessionManager
+
+_client: Optional[Any] = None
+
+
+def get_client() -> Any:
+    """Return a Route 53 client shared by all scripts, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = SessionManager().get_route53_client()
+    return _client
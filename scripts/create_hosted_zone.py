@@ -1,20 +1,35 @@
-import boto3
+import uuid
+from typing import Optional
+
 from botocore.exceptions import ClientError
 
+from scripts._client import get_client
 from src.route53_client import Route53Client
 from src.route53_operations import Route53Operations
 from src.session_manager import SessionManager
 
 
-def create_hosted_zone(domain: str) -> None:
-    """Create a new Route 53 hosted zone."""
-    session = boto3.Session()
-    client = session.client("route53")
+def create_hosted_zone(domain: str, caller_reference: Optional[str] = None) -> None:
+    """
+    Create a new Route 53 hosted zone.
+
+    Args:
+        domain: Domain name of the zone (e.g., 'example.com').
+        caller_reference: Unique string identifying this request. Pass the
+            same value when retrying a request, so Route 53 does not create
+            a second zone. Defaults to a new random reference.
+    """
+    client = get_client()
+
+    # A reference derived from the domain alone would make Route 53 refuse
+    # a zone for a domain whose earlier zone has since been deleted
+    if caller_reference is None:
+        caller_reference = f"create-hosted-zone-{uuid.uuid4()}"
 
     try:
         response = client.create_hosted_zone(
             Name=domain,
-            CallerReference=str(hash(domain)),  # Unique reference for idempotency
+            CallerReference=caller_reference,  # Unique reference for idempotency
             HostedZoneConfig={
                 "Comment": f"Hosted zone for {domain}",
                 "PrivateZone": False,  # Set to True if it's a private hosted zone
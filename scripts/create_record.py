@@ -1,4 +1,3 @@
-from src.route53_client import Route53Client
 from src.route53_operations import Route53Operations
 from src.session_manager import SessionManager
 
@@ -13,10 +12,7 @@ def create_dns_record(
 ) -> None:
     """Create a DNS record in a specified hosted zone with dynamic record type and value."""
     session_manager = SessionManager(profile_name=profile_name)
-    session = session_manager.get_session()
-
-    route53_client = Route53Client(session=session).get_client()
-    operations = Route53Operations(route53_client)
+    operations = Route53Operations(session_manager.get_route53_client())
 
     operations.create_dns_record(
         hosted_zone_id=hosted_zone_id,
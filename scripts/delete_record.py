@@ -1,13 +1,13 @@
 from typing import Any, cast
 
-import boto3
 from botocore.exceptions import ClientError
 
+from scripts._client import get_client
+
 
 def delete_record(hosted_zone_id: str, record_name: str, record_type: str) -> None:
     """Delete a DNS record from a specified hosted zone."""
-    session = boto3.Session()
-    client = session.client("route53")
+    client = get_client()
 
     try:
         response = client.change_resource_record_sets(
@@ -1,13 +1,17 @@
+from itertools import chain
 from typing import Any, Dict, List
 
 from botocore.exceptions import ClientError
 
 
 def list_hosted_zones(client: Any) -> List[Dict[str, Any]]:
-    """List all hosted zones."""
+    """List all hosted zones, following pagination."""
     try:
-        response = client.list_hosted_zones()
-        zones: List[Dict[str, Any]] = response.get("HostedZones", [])
+        paginator = client.get_paginator("list_hosted_zones")
+        pages = paginator.paginate(PaginationConfig={"PageSize": 100})
+        zones: List[Dict[str, Any]] = list(
+            chain.from_iterable(page.get("HostedZones", []) for page in pages)
+        )
         print(f"Found {len(zones)} hosted zones")
         return zones
     except ClientError as e:
@@ -1,6 +1,8 @@
-import boto3
+from itertools import chain
+
 from botocore.exceptions import ClientError
 
+from scripts._client import get_client
 from src.route53_client import Route53Client
 from src.route53_operations import Route53Operations
 from src.session_manager import SessionManager
@@ -8,12 +10,16 @@ from src.session_manager import SessionManager
 
 def list_records(hosted_zone_id: str) -> None:
     """List all DNS records in a specified hosted zone."""
-    session = boto3.Session()
-    client = session.client("route53")
+    client = get_client()
 
     try:
-        response = client.list_resource_record_sets(HostedZoneId=hosted_zone_id)
-        records = response.get("ResourceRecordSets", [])
+        paginator = client.get_paginator("list_resource_record_sets")
+        pages = paginator.paginate(
+            HostedZoneId=hosted_zone_id, PaginationConfig={"PageSize": 300}
+        )
+        records = list(
+            chain.from_iterable(page.get("ResourceRecordSets", []) for page in pages)
+        )
 
         if not records:
             print("No DNS records found.")
@@ -1,15 +1,15 @@
 from typing import Any, cast
 
-import boto3
 from botocore.exceptions import ClientError
 
+from scripts._client import get_client
+
 
 def update_record(
     hosted_zone_id: str, record_name: str, new_value: str, record_type: str = "A"
 ) -> None:
     """Update a DNS record in a specified hosted zone."""
-    session = boto3.Session()
-    client = session.client("route53")
+    client = get_client()
 
     try:
         response = client.change_resource_record_sets(
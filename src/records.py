@@ -1,5 +1,16 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Optional,
+    Protocol,
+    Sequence,
+    Type,
+    TypedDict,
+    cast,
+)
 
 
 # AliasTarget TypedDict for Route 53 alias records
@@ -9,22 +20,17 @@ class AliasTarget(TypedDict):
     EvaluateTargetHealth: bool
 
 
-# Base class for all DNS records
-class DnsRecord(ABC):
-    """Abstract base class for all DNS record types."""
+# Interface shared by all DNS records
+class DnsRecord(Protocol):
+    """Structural interface implemented by all DNS record types."""
 
-    def __init__(self, name: str, ttl: int = 300):
-        """
-        Initialize a DNS record.
+    # Read-only, since the record classes are frozen
+    @property
+    def name(self) -> str: ...
 
-        Args:
-            name: The name of the record (e.g., 'example.com.').
-            ttl: Time to live in seconds (default: 300).
-        """
-        self.name = name
-        self.ttl = ttl
+    @property
+    def ttl(self) -> int: ...
 
-    @abstractmethod
     def get_record_set(self) -> dict:
         """
         Return the record in Route 53 API format.
@@ -32,107 +38,175 @@ class DnsRecord(ABC):
         Returns:
             A dictionary representing the resource record set.
         """
-        pass
+        ...
 
 
-# A Record class
-class ARecord(DnsRecord):
-    """Class for A records, supporting both standard and alias records."""
-
-    def __init__(
-        self,
-        name: str,
-        ttl: int = 300,
-        values: Optional[List[str]] = None,
-        alias_target: Optional[AliasTarget] = None,
-    ):
+# Common fields and serialization for the concrete record classes
+@dataclass(frozen=True)
+class _BaseRecord:
+    """
+    Fields shared by every DNS record.
+
+    Records are immutable, which makes them hashable and keeps the cached
+    record set from going stale. Record values are stripped and stored as a
+    tuple when the record is created, so serializing it needs no further
+    string work.
+
+    Attributes:
+        name: The name of the record (e.g., 'example.com.').
+        ttl: Time to live in seconds (default: 300).
+    """
+
+    name: str
+    ttl: int = 300
+
+    def get_record_set(self) -> dict:
         """
-        Initialize an A record.
+        Return the record in Route 53 API format.
+
+        The dictionary is built on first use and cached on the instance, so
+        callers must treat it as read-only.
 
-        Args:
-            name: The name of the record.
-            ttl: Time to live in seconds (default: 300).
-            values: List of IPv4 addresses (for standard A records).
-            alias_target: Dictionary with alias details (for alias A records).
+        Returns:
+            A dictionary representing the resource record set.
         """
-        super().__init__(name, ttl)
-        if values and alias_target:
+        return self._record_set
+
+    @property
+    def _record_set(self) -> dict:
+        """Build the resource record set; subclasses cache it per instance."""
+        raise NotImplementedError
+
+
+# Shared implementation of A and AAAA records
+@dataclass(frozen=True)
+class _AddressRecord(_BaseRecord):
+    """
+    Address record that is either a list of IPs or an alias.
+
+    Attributes:
+        values: IP addresses (for standard records).
+        alias_target: Dictionary with alias details (for alias records).
+    """
+
+    record_type: ClassVar[str]
+
+    values: Optional[Sequence[str]] = None
+    # Dicts are unhashable; equal records still hash equal without it
+    alias_target: Optional[AliasTarget] = field(default=None, hash=False)
+
+    def __post_init__(self) -> None:
+        if self.values and self.alias_target:
+            raise ValueError(
+                "Cannot specify both values and alias_target "
+                f"for {self.record_type} record."
+            )
+        if not self.values and not self.alias_target:
             raise ValueError(
-                "Cannot specify both values and alias_target for A record."
+                "Must specify either values or alias_target "
+                f"for {self.record_type} record."
+            )
+        # Frozen dataclasses set their own fields through object.__setattr__
+        if self.values:
+            object.__setattr__(self, "values", tuple(ip.strip() for ip in self.values))
+        else:
+            object.__setattr__(self, "values", None)
+            # Copy so later changes to the caller's dict cannot reach the record
+            object.__setattr__(
+                self, "alias_target", dict(cast(AliasTarget, self.alias_target))
             )
-        if not values and not alias_target:
-            raise ValueError("Must specify either values or alias_target for A record.")
-        self.values = values
-        self.alias_target = alias_target
-
-    def get_record_set(self) -> dict[str, Any]:
-        """Return the A record in Route 53 API format."""
-        record_set: dict[str, Any] = {
+
+    @cached_property
+    def _record_set(self) -> dict:
+        """Return the record in Route 53 API format."""
+        if self.alias_target:
+            return self._alias_record_set()
+        return self._standard_record_set()
+
+    def _alias_record_set(self) -> dict:
+        return {
             "Name": self.name,
-            "Type": "A",
+            "Type": self.record_type,
+            "AliasTarget": dict(cast(AliasTarget, self.alias_target)),
+        }
+
+    def _standard_record_set(self) -> dict:
+        return {
+            "Name": self.name,
+            "Type": self.record_type,
+            "TTL": self.ttl,
+            "ResourceRecords": [{"Value": ip} for ip in self.values or ()],
         }
-        if self.alias_target:
-            record_set["AliasTarget"] = dict(self.alias_target)
-        else:
-            record_set["TTL"] = self.ttl
-            record_set["ResourceRecords"] = [
-                {"Value": ip.strip()} for ip in (self.values or [])
-            ]
-        return record_set
+
+
+# A Record class
+@dataclass(frozen=True)
+class ARecord(_AddressRecord):
+    """
+    Class for A records, supporting both standard and alias records.
+
+    Attributes:
+        values: IPv4 addresses (for standard A records).
+        alias_target: Dictionary with alias details (for alias A records).
+    """
+
+    record_type: ClassVar[str] = "A"
 
 
 # CNAME Record class
-class CNAMERecord(DnsRecord):
-    """Class for CNAME records."""
+@dataclass(frozen=True)
+class CNAMERecord(_BaseRecord):
+    """
+    Class for CNAME records.
 
-    def __init__(self, name: str, ttl: int = 300, values: Optional[List[str]] = None):
-        """
-        Initialize a CNAME record.
+    Attributes:
+        values: A single canonical name.
+    """
 
-        Args:
-            name: The name of the record.
-            ttl: Time to live in seconds (default: 300).
-            values: List containing a single canonical name.
-        """
-        super().__init__(name, ttl)
-        if not values:
+    values: Optional[Sequence[str]] = None
+
+    def __post_init__(self) -> None:
+        if not self.values:
             raise ValueError("CNAME record requires a value.")
-        if len(values) != 1:
+        if len(self.values) != 1:
             raise ValueError("CNAME record can only have one value.")
-        self.values = values
+        object.__setattr__(self, "values", (self.values[0].strip(),))
 
-    def get_record_set(self) -> dict:
+    @cached_property
+    def _record_set(self) -> dict:
         """Return the CNAME record in Route 53 API format."""
         return {
             "Name": self.name,
             "Type": "CNAME",
             "TTL": self.ttl,
-            "ResourceRecords": [{"Value": self.values[0].strip()}],
+            "ResourceRecords": [{"Value": value} for value in self.values or ()],
         }
 
 
 # MX Record class
-class MXRecord(DnsRecord):
-    """Class for MX records."""
+@dataclass(frozen=True)
+class MXRecord(_BaseRecord):
+    """
+    Class for MX records.
 
-    def __init__(self, name: str, ttl: int = 300, values: Optional[List[str]] = None):
-        """
-        Initialize an MX record.
+    Attributes:
+        values: Strings in the format 'preference mail_server'
+               (e.g., '10 mail.example.com').
+    """
 
-        Args:
-            name: The name of the record.
-            ttl: Time to live in seconds (default: 300).
-            values: List of strings in the format 'preference mail_server'
-                   (e.g., '10 mail.example.com').
-        """
-        super().__init__(name, ttl)
-        if not values:
+    values: Optional[Sequence[str]] = None
+
+    def __post_init__(self) -> None:
+        if not self.values:
             raise ValueError("MX record requires at least one value.")
-        self.values = values
+        object.__setattr__(
+            self, "values", tuple(value.strip() for value in self.values)
+        )
 
-    def get_record_set(self) -> dict:
+    @cached_property
+    def _record_set(self) -> dict:
         """Return the MX record in Route 53 API format."""
-        resource_records = [{"Value": value.strip()} for value in self.values]
+        resource_records = [{"Value": value} for value in self.values or ()]
         return {
             "Name": self.name,
             "Type": "MX",
@@ -142,32 +216,31 @@ class MXRecord(DnsRecord):
 
 
 # TXT Record class
-class TXTRecord(DnsRecord):
-    """Class for TXT records."""
+@dataclass(frozen=True)
+class TXTRecord(_BaseRecord):
+    """
+    Class for TXT records.
 
-    def __init__(self, name: str, ttl: int = 300, values: Optional[List[str]] = None):
-        """
-        Initialize a TXT record.
+    Attributes:
+        values: Text strings.
+    """
 
-        Args:
-            name: The name of the record.
-            ttl: Time to live in seconds (default: 300).
-            values: List of text strings.
-        """
-        super().__init__(name, ttl)
-        if not values:
+    values: Optional[Sequence[str]] = None
+
+    def __post_init__(self) -> None:
+        if not self.values:
             raise ValueError("TXT record requires at least one value.")
-        self.values = values
+        object.__setattr__(
+            self, "values", tuple(value.strip() for value in self.values)
+        )
 
-    def get_record_set(self) -> dict:
+    @cached_property
+    def _record_set(self) -> dict:
         """Return the TXT record in Route 53 API format."""
+        # Slice compares avoid two method calls per value
         resource_records = [
-            (
-                {"Value": f'"{value.strip()}"'}
-                if not (value.startswith('"') and value.endswith('"'))
-                else {"Value": value.strip()}
-            )
-            for value in self.values
+            {"Value": value if value[:1] == '"' == value[-1:] else f'"{value}"'}
+            for value in self.values or ()
         ]
         return {
             "Name": self.name,
@@ -178,51 +251,17 @@ class TXTRecord(DnsRecord):
 
 
 # AAAA Record class
-class AAAARecord(DnsRecord):
-    """Class for AAAA records, supporting both standard and alias records."""
-
-    def __init__(
-        self,
-        name: str,
-        ttl: int = 300,
-        values: Optional[List[str]] = None,
-        alias_target: Optional[AliasTarget] = None,
-    ):
-        """
-        Initialize an AAAA record.
+@dataclass(frozen=True)
+class AAAARecord(_AddressRecord):
+    """
+    Class for AAAA records, supporting both standard and alias records.
 
-        Args:
-            name: The name of the record.
-            ttl: Time to live in seconds (default: 300).
-            values: List of IPv6 addresses (for standard AAAA records).
-            alias_target: Dictionary with alias details (for alias AAAA records).
-        """
-        super().__init__(name, ttl)
-        if values and alias_target:
-            raise ValueError(
-                "Cannot specify both values and alias_target for AAAA record."
-            )
-        if not values and not alias_target:
-            raise ValueError(
-                "Must specify either values or alias_target for AAAA record."
-            )
-        self.values = values
-        self.alias_target = alias_target
+    Attributes:
+        values: IPv6 addresses (for standard AAAA records).
+        alias_target: Dictionary with alias details (for alias AAAA records).
+    """
 
-    def get_record_set(self) -> dict[str, Any]:
-        """Return the AAAA record in Route 53 API format."""
-        record_set: dict[str, Any] = {
-            "Name": self.name,
-            "Type": "AAAA",
-        }
-        if self.alias_target:
-            record_set["AliasTarget"] = dict(self.alias_target)
-        else:
-            record_set["TTL"] = self.ttl
-            record_set["ResourceRecords"] = [
-                {"Value": ip.strip()} for ip in (self.values or [])
-            ]
-        return record_set
+    record_type: ClassVar[str] = "AAAA"
 
 
 # Mapping of record types to their classes
@@ -245,13 +284,15 @@ def create_record(record_type: str, **kwargs: Any) -> DnsRecord:
         **kwargs: Additional arguments specific to the record type.
 
     Returns:
-        An instance of the appropriate DnsRecord subclass.
+        An instance of the appropriate DnsRecord implementation.
 
     Raises:
         ValueError: If the record type is unknown.
     """
-    record_type = record_type.upper()
-    if record_type not in RECORD_TYPES:
-        raise ValueError(f"Unknown record type: {record_type}")
-    record_class = RECORD_TYPES[record_type]
+    # Callers normally pass upper-case types; only normalize when needed
+    record_class = RECORD_TYPES.get(record_type) or RECORD_TYPES.get(
+        record_type.upper()
+    )
+    if record_class is None:
+        raise ValueError(f"Unknown record type: {record_type.upper()}")
     return record_class(**kwargs)
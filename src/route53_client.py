@@ -1,31 +1,40 @@
-from typing import Any
-
-import boto3
+from typing import TYPE_CHECKING, Any, Optional
 
 from .utils.error_handling import Route53Error, handle_aws_errors
 from .utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+
+_logger = get_logger(__name__)
+
 
 class Route53Client:
     """Manages a boto3 Route 53 client."""
 
-    def __init__(self, session: boto3.Session):
+    def __init__(self, session: "boto3.Session", config: Optional["Config"] = None):
         """
         Initialize a Route 53 client.
 
         Args:
             session: A boto3 session object.
+            config: Optional botocore client configuration (connection pool
+                size, keep-alive, retries).
         """
-        self.logger = get_logger(__name__)
+        self.logger = _logger
 
         try:
-            self.client = session.client("route53")
+            if config is None:
+                self.client = session.client("route53")
+            else:
+                self.client = session.client("route53", config=config)
             self.logger.info("Initialized Route 53 client")
         except Exception as e:
             self.logger.error(f"Failed to initialize Route 53 client: {e}")
             raise Route53Error(f"Failed to create Route 53 client: {e}")
 
-    @handle_aws_errors(logger=get_logger(__name__))
+    @handle_aws_errors(logger=_logger)
     def get_client(self) -> Any:
         """Return the Route 53 client."""
         return self.client
@@ -1,21 +1,194 @@
-from typing import Any, Dict, List, cast
-
-from mypy_boto3_route53.client import Route53Client
+import json
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from .utils.error_handling import (
     Route53Error,
+    Route53NotFoundError,
+    Route53ValidationError,
     handle_aws_errors,
     validate_domain_name,
     validate_hosted_zone_id,
+    validate_ip_address,
 )
 from .utils.logging import get_logger
-from .utils.rate_limiter import rate_limit
+from .utils.rate_limiter import rate_limit, reserve_tokens
+
+if TYPE_CHECKING:
+    from mypy_boto3_route53.client import Route53Client
+
+_logger = get_logger(__name__)
+
+
+def _json_change_key(change: Dict[str, Any]) -> bytes:
+    """Canonical serialization of a change, used to spot duplicates."""
+    return json.dumps(change, sort_keys=True).encode()
+
+
+try:
+    import orjson
+
+    def _change_key(change: Dict[str, Any]) -> bytes:
+        """Canonical serialization of a change, used to spot duplicates."""
+        return orjson.dumps(change, option=orjson.OPT_SORT_KEYS)
+
+except ImportError:  # orjson is an optional speedup (the "fast" extra)
+    _change_key = _json_change_key
+
+
+# Route 53 accepts at most 1000 changes in a single ChangeBatch, and counts
+# each UPSERT twice (a DELETE plus a CREATE)
+MAX_CHANGES_PER_BATCH = 1000
+
+# Largest page ListResourceRecordSets returns
+RECORDS_PAGE_SIZE = 300
+
+# Backoff between polls of wait_for_change, in seconds
+CHANGE_POLL_BASE_DELAY = 2.0
+CHANGE_POLL_MAX_DELAY = 30.0
+
+# Route 53 allows 5 requests per second per account, so more threads than
+# that only queue up on the rate limiter
+MAX_CONCURRENT_REQUESTS = 5
+
+
+def _unique_changes(changes: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Drop repeated changes, keeping the first occurrence of each.
+
+    Route 53 rejects a ChangeBatch that contains the same change twice.
+    """
+    seen = set()
+    unique = []
+    for change in changes:
+        key = _change_key(change)
+        if key not in seen:
+            seen.add(key)
+            unique.append(change)
+    return unique
+
+
+def _build_change(
+    action: str, hostname: str, ip: str, ttl: int = 300
+) -> Dict[str, Any]:
+    """
+    Build a single A record change for a ChangeBatch.
+
+    The change is written as one literal rather than built through ARecord,
+    since this runs once per record in batches of hundreds.
+    """
+    return {
+        "Action": action,
+        "ResourceRecordSet": {
+            "Name": hostname,
+            "Type": "A",
+            "TTL": ttl,
+            "ResourceRecords": [{"Value": ip}],
+        },
+    }
+
+
+def _canonical_name(name: str) -> str:
+    """
+    Return a record name in the form used to compare names.
+
+    Route 53 names are case-insensitive, and listings return them in lower
+    case with a leading ``*`` escaped as ``\\052``.
+    """
+    return name.lower().replace("\\052", "*")
+
+
+def _batch_size(changes: List[Dict[str, Any]]) -> int:
+    """Return how many of these changes fit in one ChangeBatch."""
+    if any(change["Action"] == "UPSERT" for change in changes):
+        return MAX_CHANGES_PER_BATCH // 2
+    return MAX_CHANGES_PER_BATCH
+
+
+def _chunked(
+    changes: Iterable[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield successive lists of at most ``size`` changes."""
+    iterator = iter(changes)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeRef:
+    """
+    Reference to a submitted Route 53 change.
+
+    ``str()`` of a ChangeRef is its change ID, and every method taking a
+    change ID also accepts a ChangeRef. A change too large for one
+    ChangeBatch is sent as several, each with its own change ID; status()
+    and wait() then cover all of them.
+
+    Attributes:
+        id: The change ID of the last batch (e.g., '/change/C123456789').
+        submitted_at: ``time.monotonic()`` timestamp of the submission.
+        ids: The change ID of every batch, in submission order. Defaults
+            to just ``id``.
+    """
+
+    id: str
+    # Two references to the same change are equal whenever they were made
+    submitted_at: float = field(compare=False)
+    _ops: "Route53Operations" = field(repr=False, compare=False)
+    ids: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not self.ids:
+            object.__setattr__(self, "ids", (self.id,))
+
+    def __str__(self) -> str:
+        return self.id
+
+    def status(self) -> str:
+        """
+        Return the status of the change (e.g., 'PENDING', 'INSYNC').
+
+        The change is INSYNC only once every one of its batches is.
+        """
+        statuses = [self._ops.get_change_status(change_id) for change_id in self.ids]
+        return next((s for s in statuses if s != "INSYNC"), "INSYNC")
+
+    def wait(self, timeout: float = 300.0) -> str:
+        """Wait until every batch has propagated (see wait_for_change)."""
+        deadline = time.monotonic() + timeout
+        for change_id in self.ids:
+            status = self._ops.wait_for_change(
+                change_id, max(0.0, deadline - time.monotonic())
+            )
+        return status
+
+
+# A change ID string or a ChangeRef
+ChangeId = Union[str, ChangeRef]
 
 
 class Route53Operations:
     """Manages Route 53 operations like creating or updating DNS records."""
 
-    def __init__(self, route53_client: Route53Client):
+    __slots__ = ("client", "logger")
+
+    def __init__(self, route53_client: "Route53Client"):
         """
         Initialize Route 53 operations.
 
@@ -23,17 +196,17 @@ class Route53Operations:
             route53_client: A boto3 Route 53 client.
         """
         self.client = route53_client
-        self.logger = get_logger(__name__)
+        self.logger = _logger
 
     @rate_limit(adaptive=True)
-    @handle_aws_errors(logger=get_logger(__name__))
+    @handle_aws_errors(logger=_logger)
     def create_dns_record(
         self,
         hosted_zone_id: str,
         domain: str,
         load_balancer_ip: str,
         services: List[str],
-    ) -> str:
+    ) -> ChangeRef:
         """
         Create DNS A records pointing to an internal load balancer IP.
 
@@ -44,7 +217,7 @@ class Route53Operations:
             services: List of service names (e.g., ['api', 'web']).
 
         Returns:
-            Change ID for tracking the operation status.
+            Reference to the change, for tracking the operation status.
 
         Raises:
             Route53Error: If the operation fails.
@@ -54,41 +227,43 @@ class Route53Operations:
         domain = validate_domain_name(domain)
 
         if not services:
-            raise Route53Error("At least one service must be specified")
+            raise Route53ValidationError("Services list cannot be empty")
+
+        # A records only hold IPv4 addresses; reject anything else before the
+        # round trip to Route 53 would
+        load_balancer_ip = validate_ip_address(load_balancer_ip, version=4)
 
         self.logger.info(
             f"Creating DNS records for services {services} in zone {hosted_zone_id}"
         )
 
-        changes = []
-        for service in services:
-            hostname = f"{service}.{domain}"
-            changes.append(
-                {
-                    "Action": "UPSERT",
-                    "ResourceRecordSet": {
-                        "Name": hostname,
-                        "Type": "A",
-                        "TTL": 300,
-                        "ResourceRecords": [{"Value": load_balancer_ip}],
-                    },
-                }
+        suffix = "." + domain
+        # Drop repeated services up front, keeping the caller's order, so no
+        # duplicate change is built only to be discarded again
+        hostnames = [service + suffix for service in dict.fromkeys(services)]
+        changes = [
+            _build_change("UPSERT", hostname, load_balancer_ip)
+            for hostname in hostnames
+        ]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Configuring DNS: %s → %s", ", ".join(hostnames), load_balancer_ip
             )
-            self.logger.debug(f"Configuring DNS: {hostname} → {load_balancer_ip}")
 
-        response = self.client.change_resource_record_sets(
-            HostedZoneId=hosted_zone_id, ChangeBatch={"Changes": cast(Any, changes)}
+        change_ids = self._submit_changes(hosted_zone_id, changes)
+        self.logger.info(
+            f"Created DNS records successfully (Change IDs: {', '.join(change_ids)})"
         )
-        change_id = str(response["ChangeInfo"]["Id"])
-        self.logger.info(f"Created DNS records successfully (Change ID: {change_id})")
 
-        return change_id
+        return ChangeRef(change_ids[-1], time.monotonic(), self, tuple(change_ids))
 
-    @rate_limit()
-    @handle_aws_errors(logger=get_logger(__name__))
+    @handle_aws_errors(logger=_logger)
     def list_records(self, hosted_zone_id: str) -> List[Dict[str, Any]]:
         """
-        List all records in a hosted zone.
+        List all records in a hosted zone, following pagination.
+
+        Use iter_records instead for large zones that need not be held in
+        memory at once.
 
         Args:
             hosted_zone_id: ID of the Route 53 hosted zone.
@@ -102,16 +277,62 @@ class Route53Operations:
         hosted_zone_id = validate_hosted_zone_id(hosted_zone_id)
         self.logger.info(f"Listing records for hosted zone {hosted_zone_id}")
 
-        response = self.client.list_resource_record_sets(HostedZoneId=hosted_zone_id)
-        records = response.get("ResourceRecordSets", [])
+        records = list(self._iter_record_sets(hosted_zone_id))
         self.logger.info(f"Found {len(records)} records in zone {hosted_zone_id}")
-        return cast(List[Dict[str, Any]], records)
+        return records
+
+    def iter_records(self, hosted_zone_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all records in a hosted zone, one page at a time.
+
+        Unlike list_records, pages are fetched lazily as the iterator is
+        consumed, so large zones are never held in memory at once.
+
+        Args:
+            hosted_zone_id: ID of the Route 53 hosted zone.
+
+        Returns:
+            Iterator of resource record sets.
+
+        Raises:
+            Route53Error: If the zone ID is invalid or fetching a page fails.
+        """
+        hosted_zone_id = validate_hosted_zone_id(hosted_zone_id)
+        self.logger.info(f"Streaming records for hosted zone {hosted_zone_id}")
+        return self._iter_record_sets(hosted_zone_id)
+
+    def list_records_many(
+        self, hosted_zone_ids: List[str], max_workers: int = MAX_CONCURRENT_REQUESTS
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List the records of several hosted zones concurrently.
+
+        The client is shared between worker threads (boto3 clients are
+        thread-safe) and every call still goes through the rate limiter.
+
+        Args:
+            hosted_zone_ids: IDs of the Route 53 hosted zones.
+            max_workers: Maximum number of zones fetched at the same time.
+
+        Returns:
+            Mapping of each hosted zone ID to its resource record sets.
+
+        Raises:
+            Route53Error: If listing any of the zones fails.
+        """
+        if not hosted_zone_ids:
+            return {}
+
+        workers = min(max_workers, len(hosted_zone_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.list_records, hosted_zone_ids)
+            return dict(zip(hosted_zone_ids, results))
 
     @rate_limit(adaptive=True)
-    @handle_aws_errors(logger=get_logger(__name__))
+    @handle_aws_errors(logger=_logger)
     def delete_dns_records(
         self, hosted_zone_id: str, domain: str, services: List[str]
-    ) -> str:
+    ) -> ChangeRef:
         """
         Delete DNS A records for the given services.
 
@@ -121,7 +342,7 @@ class Route53Operations:
             services: List of service names (e.g., ['api', 'web']).
 
         Returns:
-            Change ID for tracking the operation status.
+            Reference to the change, for tracking the operation status.
 
         Raises:
             Route53Error: If the operation fails.
@@ -131,37 +352,153 @@ class Route53Operations:
         domain = validate_domain_name(domain)
 
         if not services:
-            raise Route53Error("At least one service must be specified")
+            raise Route53ValidationError("Services list cannot be empty")
 
         self.logger.info(
             f"Deleting DNS records for services {services} in zone {hosted_zone_id}"
         )
 
-        changes = []
-        for service in services:
-            hostname = f"{service}.{domain}"
-            changes.append(
-                {
-                    "Action": "DELETE",
-                    "ResourceRecordSet": {"Name": hostname, "Type": "A"},
-                }
+        suffix = "." + domain
+        hostnames = {_canonical_name(service + suffix) for service in services}
+
+        # DELETE must echo the full record set; one pass over the zone finds
+        # every service's record, however many services are given
+        changes: List[Dict[str, Any]] = [
+            {"Action": "DELETE", "ResourceRecordSet": record_set}
+            for record_set in self._iter_record_sets(hosted_zone_id)
+            if record_set["Type"] == "A"
+            and _canonical_name(record_set["Name"]) in hostnames
+        ]
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Deleting DNS: %s",
+                ", ".join(c["ResourceRecordSet"]["Name"] for c in changes),
             )
-            self.logger.debug(f"Deleting DNS: {hostname}")
 
-        response = self.client.change_resource_record_sets(
-            HostedZoneId=hosted_zone_id, ChangeBatch={"Changes": cast(Any, changes)}
+        missing = hostnames - {
+            _canonical_name(c["ResourceRecordSet"]["Name"]) for c in changes
+        }
+        if missing:
+            self.logger.warning(f"No A records found for {sorted(missing)}, skipping")
+        if not changes:
+            raise Route53NotFoundError(
+                f"No matching A records found in zone {hosted_zone_id}"
+            )
+
+        change_ids = self._submit_changes(hosted_zone_id, changes)
+        self.logger.info(
+            f"Deleted DNS records successfully (Change IDs: {', '.join(change_ids)})"
         )
-        change_id = str(response["ChangeInfo"]["Id"])
-        self.logger.info(f"Deleted DNS records successfully (Change ID: {change_id})")
 
-        return change_id
+        return ChangeRef(change_ids[-1], time.monotonic(), self, tuple(change_ids))
+
+    @rate_limit(adaptive=True)
+    @handle_aws_errors(logger=_logger)
+    def submit_change_batch(
+        self, hosted_zone_id: str, changes: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Submit arbitrary record changes, batching them into as few calls as possible.
+
+        Batches hold up to ``MAX_CHANGES_PER_BATCH`` changes, or half as many
+        when any of them is an UPSERT, since Route 53 counts those twice.
+
+        Args:
+            hosted_zone_id: ID of the Route 53 hosted zone.
+            changes: Change dicts, each with ``Action`` and ``ResourceRecordSet``.
+
+        Returns:
+            Change IDs, one per ``ChangeResourceRecordSets`` call issued.
+
+        Raises:
+            Route53Error: If the operation fails.
+        """
+        hosted_zone_id = validate_hosted_zone_id(hosted_zone_id)
+
+        if not changes:
+            raise Route53Error("At least one change must be specified")
+
+        return self._submit_changes(hosted_zone_id, changes)
+
+    def submit_change_batches(
+        self,
+        changes_by_zone: Dict[str, List[Dict[str, Any]]],
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> Dict[str, List[str]]:
+        """
+        Submit record changes to several hosted zones concurrently.
+
+        Each zone's changes go through submit_change_batch, so the shared rate
+        limiter still caps the total request rate across all workers.
+
+        Args:
+            changes_by_zone: Mapping of hosted zone ID to its change dicts.
+            max_workers: Maximum number of zones updated at the same time.
+
+        Returns:
+            Mapping of each hosted zone ID to the change IDs of its batches.
+
+        Raises:
+            Route53Error: If submitting the changes of any zone fails.
+        """
+        if not changes_by_zone:
+            return {}
+
+        workers = min(max_workers, len(changes_by_zone))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                self.submit_change_batch, changes_by_zone, changes_by_zone.values()
+            )
+            return dict(zip(changes_by_zone, results))
+
+    def _submit_changes(
+        self, hosted_zone_id: str, changes: List[Dict[str, Any]]
+    ) -> List[str]:
+        """Send changes in as few ChangeBatches as Route 53's limits allow."""
+        unique = _unique_changes(changes)
+        batches = list(_chunked(unique, _batch_size(unique)))
+        # The caller's rate_limit decorator paid for the first call only
+        reserve_tokens(len(batches) - 1, logger=self.logger)
+
+        change_ids = []
+        for batch in batches:
+            response = self.client.change_resource_record_sets(
+                HostedZoneId=hosted_zone_id, ChangeBatch={"Changes": cast(Any, batch)}
+            )
+            change_ids.append(str(response["ChangeInfo"]["Id"]))
+            self.logger.debug(
+                f"Submitted {len(batch)} changes (Change ID: {change_ids[-1]})"
+            )
+        return change_ids
+
+    def _iter_record_sets(self, hosted_zone_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield every resource record set in a zone, following pagination."""
+        paginator = self.client.get_paginator("list_resource_record_sets")
+        pages = iter(
+            paginator.paginate(
+                HostedZoneId=hosted_zone_id,
+                PaginationConfig={"PageSize": RECORDS_PAGE_SIZE},
+            )
+        )
+        while (page := self._fetch_page(pages)) is not None:
+            for record_set in page.get("ResourceRecordSets", []):
+                yield cast(Dict[str, Any], record_set)
 
     @rate_limit()
-    @handle_aws_errors(logger=get_logger(__name__))
-    def get_change_status(self, change_id: str) -> str:
+    @handle_aws_errors(logger=_logger)
+    def _fetch_page(self, pages: Iterator[Any]) -> Optional[Dict[str, Any]]:
+        """Fetch the next page from a paginator (one API call), or None at the end."""
+        return cast(Optional[Dict[str, Any]], next(pages, None))
+
+    @rate_limit()
+    @handle_aws_errors(logger=_logger)
+    def get_change_status(self, change_id: ChangeId) -> str:
         """
         Get the status of a Route 53 change.
 
+        This is a one-shot query; to wait for a change to propagate use
+        wait_for_change instead of calling this in a loop.
+
         Args:
             change_id: ID of the change to check.
 
@@ -173,6 +510,7 @@ class Route53Operations:
         """
         if not change_id:
             raise Route53Error("Change ID cannot be empty")
+        change_id = str(change_id)
 
         self.logger.debug(f"Checking status for change ID: {change_id}")
 
@@ -180,3 +518,73 @@ class Route53Operations:
         status: str = response["ChangeInfo"]["Status"]
         self.logger.debug(f"Change {change_id} status: {status}")
         return status
+
+    def iter_change_statuses(
+        self, change_ids: List[ChangeId], max_workers: int = MAX_CONCURRENT_REQUESTS
+    ) -> Iterator[Tuple[ChangeId, str]]:
+        """
+        Get the status of several Route 53 changes concurrently.
+
+        Route 53 has no bulk GetChange call, so the polls are overlapped on a
+        thread pool instead, each still going through the rate limiter.
+
+        Args:
+            change_ids: IDs of the changes to check.
+            max_workers: Maximum number of changes polled at the same time.
+
+        Yields:
+            (change ID, status) pairs in the order the polls complete.
+
+        Raises:
+            Route53Error: If checking any of the changes fails.
+        """
+        if not change_ids:
+            return
+
+        workers = min(max_workers, len(change_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.get_change_status, change_id): change_id
+                for change_id in change_ids
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def wait_for_change(self, change_id: ChangeId, timeout: float = 300.0) -> str:
+        """
+        Wait until a Route 53 change has propagated.
+
+        Polls with exponential backoff and random jitter, so that several
+        callers waiting at once do not poll in lockstep against the rate limit.
+
+        Args:
+            change_id: ID of the change to wait for.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            The final status of the change ('INSYNC').
+
+        Raises:
+            Route53Error: If the change is not INSYNC within the timeout or
+                the status cannot be retrieved.
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+
+        while (status := self.get_change_status(change_id)) != "INSYNC":
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise Route53Error(
+                    f"Timed out after {timeout}s waiting for change {change_id} "
+                    f"(status: {status})"
+                )
+
+            delay = min(CHANGE_POLL_MAX_DELAY, CHANGE_POLL_BASE_DELAY * 2**attempt)
+            delay *= random.uniform(0.5, 1.5)
+            self.logger.debug(
+                f"Change {change_id} is {status}, polling again in {delay:.1f}s"
+            )
+            time.sleep(min(delay, remaining))
+            attempt += 1
+
+        return str(status)
@@ -1,16 +1,38 @@
-from typing import Optional
-
-import boto3
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, cast
 
 from .utils.error_handling import Route53Error, handle_aws_errors
 from .utils.logging import get_logger
 
+if TYPE_CHECKING:
+    import boto3
+
+_logger = get_logger(__name__)
+
+# Connections kept in each client's pool; botocore's default of 10 makes
+# concurrent callers discard and re-handshake connections
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
 
 class SessionManager:
     """Manages a boto3 session for AWS interactions."""
 
+    __slots__ = (
+        "logger",
+        "profile_name",
+        "region_name",
+        "session",
+        "client_config",
+        "_clients",
+        "_clients_lock",
+        "_credentials",
+    )
+
     def __init__(
-        self, profile_name: Optional[str] = None, region_name: str = "us-east-1"
+        self,
+        profile_name: Optional[str] = None,
+        region_name: str = "us-east-1",
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
     ):
         """
         Initialize a boto3 session.
@@ -18,11 +40,32 @@ class SessionManager:
         Args:
             profile_name: AWS profile name to use, if specified.
             region_name: AWS region to use (default: 'us-east-1').
+            max_pool_connections: Size of the HTTP connection pool of clients
+                created by this manager (default: 50).
         """
-        self.logger = get_logger(__name__)
+        self.logger = _logger
         self.profile_name = profile_name
         self.region_name = region_name
 
+        # boto3 is only imported once a session is actually needed: loading it
+        # and its service models is most of the package's import time
+        import boto3
+        from botocore.config import Config
+
+        # Keep connections alive between calls instead of re-handshaking TLS
+        self.client_config = Config(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            # Pacing is left to the shared AdaptiveRateLimiter; botocore's own
+            # adaptive mode would throttle the same calls a second time
+            retries={"max_attempts": 3, "mode": "standard"},
+        )
+
+        # Clients are thread-safe, so one per service is shared by all callers
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+        self._credentials: Optional[Any] = None
+
         try:
             self.session = boto3.Session(
                 profile_name=profile_name, region_name=region_name
@@ -35,20 +78,77 @@ class SessionManager:
             self.logger.error(f"Failed to initialize AWS session: {e}")
             raise Route53Error(f"Failed to create AWS session: {e}")
 
-    @handle_aws_errors(logger=get_logger(__name__))
-    def get_session(self) -> boto3.Session:
+    @handle_aws_errors(logger=_logger)
+    def get_session(self) -> "boto3.Session":
         """Return the boto3 session object."""
         return self.session
 
+    def get_client(self, service_name: str) -> Any:
+        """
+        Return a client for an AWS service using this manager's configuration.
+
+        Each client is created on first use and reused afterwards, since
+        building one (loading the service model, resolving endpoints) is
+        expensive.
+
+        Args:
+            service_name: Name of the AWS service (e.g., 'route53').
+
+        Returns:
+            The boto3 client for the service.
+
+        Raises:
+            Route53Error: If the client cannot be created.
+        """
+        client = self._clients.get(service_name)
+        if client is not None:
+            return client
+
+        with self._clients_lock:
+            # Another thread may have created it while we waited for the lock
+            client = self._clients.get(service_name)
+            if client is None:
+                try:
+                    # boto3's stubs overload client() on literal service
+                    # names, which an arbitrary str cannot match
+                    client = self.session.client(
+                        cast(Any, service_name), config=self.client_config
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to create {service_name} client: {e}")
+                    raise Route53Error(f"Failed to create {service_name} client: {e}")
+                self._clients[service_name] = client
+                self.logger.info(f"Initialized {service_name} client")
+        return client
+
+    def get_route53_client(self) -> Any:
+        """
+        Return the shared Route 53 client.
+
+        Returns:
+            The Route 53 client.
+
+        Raises:
+            Route53Error: If the client cannot be created.
+        """
+        return self.get_client("route53")
+
     def get_credentials(self) -> dict:
         """
         Get current session credentials (for debugging/validation).
 
+        The credentials are resolved through the provider chain (environment,
+        shared files, instance metadata) on the first call only. Refreshable
+        credentials renew themselves when read, so the cached object stays
+        valid.
+
         Returns:
             Dictionary with credential information (without secrets)
         """
         try:
-            credentials = self.session.get_credentials()
+            if self._credentials is None:
+                self._credentials = self.session.get_credentials()
+            credentials = self._credentials
             if credentials:
                 return {
                     "access_key_id": credentials.access_key[:8] + "...",
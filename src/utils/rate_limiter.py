@@ -1,11 +1,19 @@
+import itertools
 import logging
 import threading
 import time
 from functools import wraps
-from typing import Any, Callable, Optional, TypeVar, Union, cast
+from typing import Any, Callable, NoReturn, Optional, TypeVar, Union, cast
+
+from botocore.exceptions import ClientError
+
+from .error_handling import Route53ThrottleError
 
 T = TypeVar("T")
 
+# Error codes Route 53 uses to ask callers to slow down
+_THROTTLE_CODES = frozenset({"Throttling", "PriorRequestNotComplete"})
+
 
 class RateLimiter:
     """
@@ -13,14 +21,33 @@ class RateLimiter:
 
     This implements a token bucket algorithm that allows bursts up to the bucket size
     while maintaining a steady rate over time.
+
+    The bucket is stored as a single ``time.monotonic_ns()`` timestamp,
+    ``zero_time``: the moment at which it was (or would have been) empty.
+    Each token takes a fixed number of nanoseconds to accumulate, so the
+    tokens available at ``now`` are ``(now - zero_time) / ns_per_token``,
+    capped at the bucket size. Acquiring is integer arithmetic on that one
+    timestamp, with no separate refill step and no float rounding to drift.
     """
 
+    # Fixed attribute storage keeps instances small and attribute access cheap
+    __slots__ = (
+        "zero_time",
+        "cond",
+        "_ns_per_token",
+        "_cap_ns",
+        "max_calls",
+        "time_window",
+        "bucket_size",
+    )
+
     max_calls: int
     time_window: float
     bucket_size: int
-    tokens: int
-    last_refill: float
-    lock: threading.Lock
+    zero_time: int
+    cond: threading.Condition
+    _ns_per_token: int
+    _cap_ns: int
 
     def __init__(
         self,
@@ -39,9 +66,19 @@ class RateLimiter:
         self.max_calls = max_calls
         self.time_window = time_window
         self.bucket_size = bucket_size or max_calls
-        self.tokens = self.bucket_size
-        self.last_refill = time.time()
-        self.lock = threading.Lock()
+        # Nanoseconds per token and for a full bucket, computed once rather
+        # than on every acquire
+        self._ns_per_token = max(1, int(1e9 * time_window / max_calls))
+        self._cap_ns = self.bucket_size * self._ns_per_token
+        # Start with a full bucket
+        self.zero_time = time.monotonic_ns() - self._cap_ns
+        self.cond = threading.Condition(threading.Lock())
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently in the bucket."""
+        elapsed = time.monotonic_ns() - self.zero_time
+        return min(self.bucket_size, elapsed / self._ns_per_token)
 
     def acquire(self, tokens: int = 1) -> bool:
         """
@@ -53,20 +90,7 @@ class RateLimiter:
         Returns:
             True if tokens were acquired, False otherwise
         """
-        with self.lock:
-            now = time.time()
-
-            # Refill tokens based on elapsed time
-            elapsed = now - self.last_refill
-            tokens_to_add = elapsed * (self.max_calls / self.time_window)
-            self.tokens = int(min(self.bucket_size, self.tokens + tokens_to_add))
-            self.last_refill = now
-
-            # Check if we have enough tokens
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            return False
+        return self._try_acquire(tokens) == 0.0
 
     def wait_for_tokens(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
         """
@@ -79,22 +103,47 @@ class RateLimiter:
         Returns:
             True if tokens were acquired, False if timeout
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout if timeout else None
 
-        while True:
-            if self.acquire(tokens):
-                return True
+        # The condition's lock is released while waiting, so other callers
+        # can take tokens in the meantime
+        with self.cond:
+            while wait := self._take(tokens):
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
 
-            if timeout and (time.time() - start_time) >= timeout:
-                return False
+                # Sleep until the tokens should exist rather than polling
+                self.cond.wait(wait)
 
-            # Calculate sleep time until next token is available
-            with self.lock:
-                time_per_token = self.time_window / self.max_calls
-                tokens_needed = tokens - self.tokens
-                sleep_time = min(0.1, tokens_needed * time_per_token)
+        return True
+
+    def _try_acquire(self, tokens: int) -> float:
+        """
+        Acquire tokens if available.
+
+        Returns:
+            0.0 if the tokens were acquired, otherwise the seconds until
+            enough tokens will have accumulated
+        """
+        with self.cond:
+            return self._take(tokens)
+
+    def _take(self, tokens: int) -> float:
+        """Like _try_acquire, but the caller must hold ``self.cond``."""
+        now = time.monotonic_ns()
 
-            time.sleep(sleep_time)
+        # Time idle beyond a full bucket earns nothing; partial tokens are
+        # kept, since truncating them would starve frequent callers
+        ready = max(self.zero_time, now - self._cap_ns) + tokens * self._ns_per_token
+        if ready > now:
+            return (ready - now) / 1e9
+
+        # Move the empty point forward by the tokens taken
+        self.zero_time = ready
+        return 0.0
 
 
 class AdaptiveRateLimiter:
@@ -105,15 +154,35 @@ class AdaptiveRateLimiter:
     success/failure patterns and response times.
     """
 
-    current_rate: float
+    # Fields read on every call come first; the rarely written tuning
+    # parameters and counters follow
+    __slots__ = (
+        "last_call",
+        "_interval",
+        "blocked_until",
+        "_current_rate",
+        "lock",
+        "_successes",
+        "success_count",
+        "error_count",
+        "min_rate",
+        "max_rate",
+        "backoff_factor",
+        "recovery_factor",
+    )
+
     min_rate: float
     max_rate: float
     backoff_factor: float
     recovery_factor: float
     last_call: float
+    blocked_until: float
     lock: threading.Lock
+    _interval: float
+    _current_rate: float
     success_count: int
     error_count: int
+    _successes: "itertools.count[int]"
 
     def __init__(
         self,
@@ -139,45 +208,133 @@ class AdaptiveRateLimiter:
         self.backoff_factor = backoff_factor
         self.recovery_factor = recovery_factor
         self.last_call = 0.0
+        self.blocked_until = 0.0
         self.lock = threading.Lock()
         self.success_count = 0
         self.error_count = 0
+        # next() on itertools.count is atomic, so counting needs no lock
+        self._successes = itertools.count(1)
 
     def wait_and_acquire(self) -> None:
         """Wait for the appropriate interval before allowing the next call."""
-        with self.lock:
-            now = time.time()
-            time_since_last = now - self.last_call
-            required_interval = 1.0 / self.current_rate
-
-            if time_since_last < required_interval:
-                sleep_time = required_interval - time_since_last
-                time.sleep(sleep_time)
+        # Fast path: when the unlocked read says no wait is needed, only take
+        # the lock to claim the slot, re-checking in case another thread
+        # claimed it first
+        now = time.monotonic()
+        if self._is_due(now):
+            with self.lock:
+                if self._is_due(now):
+                    self.last_call = now
+                    return
 
-            self.last_call = time.time()
+        # Slow path: reserve the next free slot under the lock, then sleep
+        # until it without holding the lock. last_call may lie in the future,
+        # which makes later callers queue behind this reservation.
+        with self.lock:
+            now = time.monotonic()
+            # Honour any Retry-After the service sent with a throttle error
+            slot = max(now, self.last_call + self._interval, self.blocked_until)
+            self.last_call = slot
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _is_due(self, now: float) -> bool:
+        """Whether a call made at ``now`` needs no wait."""
+        return now - self.last_call >= self._interval and now >= self.blocked_until
+
+    @property
+    def current_rate(self) -> float:
+        """Requests per second currently allowed."""
+        return self._current_rate
+
+    @current_rate.setter
+    def current_rate(self, rate: float) -> None:
+        # Keep the seconds between calls alongside the rate, so pacing a
+        # call needs no division
+        self._current_rate = rate
+        self._interval = 1.0 / rate
 
     def report_success(self) -> None:
         """Report a successful operation to potentially increase rate."""
-        with self.lock:
-            self.success_count += 1
+        self.success_count = count = next(self._successes)
 
-            # Increase rate after consecutive successes
-            if self.success_count % 5 == 0:  # Every 5 successes
+        # Increase rate after consecutive successes; only this needs the lock
+        if count % 5 == 0:  # Every 5 successes
+            with self.lock:
                 self.current_rate = min(
                     self.max_rate, self.current_rate * self.recovery_factor
                 )
                 self.error_count = 0  # Reset error count
 
-    def report_error(self, is_throttle_error: bool = False) -> None:
-        """Report an error to potentially decrease rate."""
+    def report_error(
+        self, is_throttle_error: bool = False, retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Report an error to potentially decrease rate.
+
+        Args:
+            is_throttle_error: Whether the service rejected the call as throttled
+            retry_after: Seconds the service asked to wait before the next call
+        """
         with self.lock:
             self.error_count += 1
-            self.success_count = 0  # Reset success count
+            # Reset success count
+            self._successes = itertools.count(1)
+            self.success_count = 0
 
             # More aggressive backoff for throttle errors
             factor = 0.25 if is_throttle_error else self.backoff_factor
             self.current_rate = max(self.min_rate, self.current_rate * factor)
 
+            if retry_after:
+                self.blocked_until = max(
+                    self.blocked_until, time.monotonic() + retry_after
+                )
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """
+    Return the Retry-After delay sent with a failed AWS call, if any.
+
+    The header is looked up on the error itself and on the botocore error it
+    was raised from, since callers usually wrap ClientError.
+    """
+    for exc in (error, error.__cause__, error.__context__):
+        response = getattr(exc, "response", None)
+        if not isinstance(response, dict):
+            continue
+        headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+        value = headers.get("retry-after")
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _is_throttle(error: Exception) -> bool:
+    """Return whether an error means Route 53 is asking us to slow down."""
+    # Classify by type: formatting a ClientError to search its message
+    # would serialize the whole error response
+    if isinstance(error, Route53ThrottleError):
+        return True
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in _THROTTLE_CODES
+    return False
+
+
+# Seconds a call waits for a token bucket before it is rejected
+_BUCKET_TIMEOUT = 30.0
+
+
+def _bucket_timeout(logger: Optional[logging.Logger]) -> NoReturn:
+    """Reject a call whose token bucket stayed empty for too long."""
+    if logger:
+        logger.error("Rate limiter timeout - request rejected")
+    raise TimeoutError("Rate limiter timeout")
+
 
 # Global rate limiters for different AWS services
 _rate_limiters = {
@@ -186,6 +343,93 @@ _rate_limiters = {
 }
 
 
+# Bumped by set_rate_limiter so decorated functions know to re-resolve
+_generation = 0
+
+
+def _regular_wrapper(
+    func: Callable[..., T], limiter: RateLimiter, logger: Optional[logging.Logger]
+) -> Callable[..., T]:
+    """Return ``func`` guarded by a token bucket."""
+    # Bind the methods once so each call skips the attribute lookups
+    wait_for_tokens = limiter.wait_for_tokens
+
+    def call(*args: Any, **kwargs: Any) -> T:
+        if not wait_for_tokens(timeout=_BUCKET_TIMEOUT):
+            _bucket_timeout(logger)
+        return func(*args, **kwargs)
+
+    return call
+
+
+def _adaptive_wrapper(
+    func: Callable[..., T],
+    limiter: AdaptiveRateLimiter,
+    bucket: Optional[RateLimiter],
+    logger: Optional[logging.Logger],
+) -> Callable[..., T]:
+    """Return ``func`` paced by an adaptive limiter and, if given, a bucket."""
+    # Bind the methods once so each call skips the attribute lookups
+    wait_for_tokens = bucket.wait_for_tokens if bucket is not None else None
+    wait_and_acquire = limiter.wait_and_acquire
+    report_success = limiter.report_success
+
+    def call(*args: Any, **kwargs: Any) -> T:
+        if wait_for_tokens is not None and not wait_for_tokens(timeout=_BUCKET_TIMEOUT):
+            _bucket_timeout(logger)
+        wait_and_acquire()
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            is_throttle = _is_throttle(e)
+
+            limiter.report_error(
+                is_throttle_error=is_throttle,
+                retry_after=_retry_after(e) if is_throttle else None,
+            )
+
+            if logger and is_throttle:
+                logger.warning(
+                    f"Throttling detected, reducing rate to "
+                    f"{limiter.current_rate:.2f} req/s"
+                )
+
+            raise
+
+        report_success()
+        return result
+
+    return call
+
+
+def _bind(
+    func: Callable[..., T],
+    limiter_name: str,
+    adaptive: bool,
+    logger: Optional[logging.Logger],
+) -> Callable[..., T]:
+    """Resolve the named limiter and return the matching call path for it."""
+    limiter_key = f"{limiter_name}_adaptive" if adaptive else limiter_name
+    limiter = _rate_limiters.get(limiter_key)
+
+    if not limiter:
+        if logger:
+            logger.warning(
+                f"Rate limiter '{limiter_key}' not found, "
+                "proceeding without rate limiting"
+            )
+        return func
+
+    if isinstance(limiter, AdaptiveRateLimiter):
+        bucket = _rate_limiters.get(limiter_name) if adaptive else None
+        return _adaptive_wrapper(
+            func, limiter, bucket if isinstance(bucket, RateLimiter) else None, logger
+        )
+
+    return _regular_wrapper(func, cast(RateLimiter, limiter), logger)
+
+
 def rate_limit(
     limiter_name: str = "route53",
     adaptive: bool = False,
@@ -194,6 +438,13 @@ def rate_limit(
     """
     Decorator to apply rate limiting to functions.
 
+    Adaptive calls also take a token from the regular limiter of the same
+    name, so every call shares one request budget (Route 53 allows 5 requests
+    per second per account, whichever API is called).
+
+    The limiter is looked up when the function is decorated rather than on
+    every call; it is looked up again only after set_rate_limiter is used.
+
     Args:
         limiter_name: Name of the rate limiter to use
         adaptive: Whether to use adaptive rate limiting
@@ -204,56 +455,51 @@ def rate_limit(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        bound = _bind(func, limiter_name, adaptive, logger)
+        bound_generation = _generation
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            limiter_key = f"{limiter_name}_adaptive" if adaptive else limiter_name
-            limiter = _rate_limiters.get(limiter_key)
-
-            if not limiter:
-                if logger:
-                    logger.warning(
-                        f"Rate limiter '{limiter_key}' not found, "
-                        "proceeding without rate limiting"
-                    )
-                return func(*args, **kwargs)
-
-            # Apply rate limiting
-            if isinstance(limiter, AdaptiveRateLimiter):
-                limiter.wait_and_acquire()
-
-                try:
-                    result = func(*args, **kwargs)
-                    limiter.report_success()
-                    return result
-                except Exception as e:
-                    # Check if it's a throttle error
-                    is_throttle = (
-                        hasattr(e, "error_code") and e.error_code == "Throttling"
-                    ) or "throttle" in str(e).lower()
-
-                    limiter.report_error(is_throttle_error=is_throttle)
-
-                    if logger and is_throttle:
-                        logger.warning(
-                            f"Throttling detected, reducing rate to "
-                            f"{limiter.current_rate:.2f} req/s"
-                        )
-
-                    raise
-
-            else:  # Regular RateLimiter
-                if not cast(RateLimiter, limiter).wait_for_tokens(timeout=30.0):
-                    if logger:
-                        logger.error("Rate limiter timeout - request rejected")
-                    raise TimeoutError("Rate limiter timeout")
-
-                return func(*args, **kwargs)
+            nonlocal bound, bound_generation
+            if bound_generation != _generation:
+                bound = _bind(func, limiter_name, adaptive, logger)
+                bound_generation = _generation
+            return bound(*args, **kwargs)
 
         return wrapper
 
     return decorator
 
 
+def reserve_tokens(
+    tokens: int, limiter_name: str = "route53", logger: Optional[logging.Logger] = None
+) -> None:
+    """
+    Take request tokens for several upcoming calls from a named bucket.
+
+    A batch of calls pays with one wait_for_tokens per full bucket instead of
+    one per call. Each wait asks for at most ``bucket_size`` tokens, which a
+    bucket can hold, so a large reservation cannot wait forever.
+
+    Args:
+        tokens: Number of calls to pay for
+        limiter_name: Name of the token bucket to draw from
+        logger: Logger for rate limiting events
+
+    Raises:
+        TimeoutError: If the bucket stays too empty for the reservation
+    """
+    bucket = _rate_limiters.get(limiter_name)
+    if not isinstance(bucket, RateLimiter):
+        return
+
+    while tokens > 0:
+        take = min(tokens, bucket.bucket_size)
+        if not bucket.wait_for_tokens(tokens=take, timeout=_BUCKET_TIMEOUT):
+            _bucket_timeout(logger)
+        tokens -= take
+
+
 def get_rate_limiter(name: str) -> Optional[Union[RateLimiter, AdaptiveRateLimiter]]:
     """
     Get a rate limiter by name.
@@ -279,4 +525,6 @@ def set_rate_limiter(
         name: Name of the rate limiter
         limiter: Rate limiter instance
     """
+    global _generation
     _rate_limiters[name] = limiter
+    _generation += 1
@@ -0,0 +1,78 @@
+"""Shared fixtures for the test suite."""
+
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
+
+import pytest
+
+from src.utils.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    get_rate_limiter,
+    set_rate_limiter,
+)
+
+# boto3 and moto take about half a second to import; the fixtures import
+# them on first use, so runs that need neither skip that cost
+if TYPE_CHECKING:
+    import boto3
+    from moto.core.models import MockAWS
+
+
+@pytest.fixture(autouse=True)
+def fast_rate_limiters() -> Iterator[None]:
+    """Swap the shared Route 53 limiters for ones that never make a test wait."""
+    originals: Dict[str, Optional[Union[RateLimiter, AdaptiveRateLimiter]]] = {
+        name: get_rate_limiter(name) for name in ("route53", "route53_adaptive")
+    }
+    set_rate_limiter("route53", RateLimiter(max_calls=1_000_000, time_window=1.0))
+    set_rate_limiter(
+        "route53_adaptive",
+        AdaptiveRateLimiter(initial_rate=1_000_000.0, max_rate=1_000_000.0),
+    )
+    yield
+    for name, limiter in originals.items():
+        if limiter is not None:
+            set_rate_limiter(name, limiter)
+
+
+@pytest.fixture(scope="session")
+def aws_mock() -> Iterator["MockAWS"]:
+    """Start moto once for the whole session rather than once per test."""
+    from moto import mock_aws
+
+    with mock_aws() as mock:
+        yield mock
+
+
+@pytest.fixture(scope="session")
+def boto_session(aws_mock: "MockAWS") -> "boto3.Session":
+    """
+    Share one boto3 session, which caches the loaded service models.
+
+    Clients built from it after the first take a few milliseconds, so tests
+    still get a client of their own to patch freely.
+    """
+    import boto3
+
+    return boto3.Session(region_name="us-east-1")
+
+
+@pytest.fixture
+def route53_client(aws_mock: "MockAWS", boto_session: "boto3.Session") -> Any:
+    """Provide a mocked Route53 client backed by an empty account."""
+    # Resetting the backends is far cheaper than restarting moto, and keeps
+    # zones and records from leaking between tests
+    aws_mock.reset()
+    return boto_session.client("route53")
+
+
+@pytest.fixture
+def hosted_zone(route53_client: Any) -> str:
+    """Create an empty example.com hosted zone and return its ID."""
+    # Real Route 53 refuses a reused CallerReference, and some modules keep
+    # one account across their tests
+    hosted_zone = route53_client.create_hosted_zone(
+        Name="example.com", CallerReference=f"test-{uuid.uuid4()}"
+    )
+    return str(hosted_zone["HostedZone"]["Id"].split("/")[-1])
@@ -0,0 +1,16 @@
+"""Helpers shared by several test modules."""
+
+from typing import Any, Dict
+
+
+def a_record_change(name: str, ip: str, action: str = "CREATE") -> Dict[str, Any]:
+    """Build a ChangeBatch change for an A record with the default TTL."""
+    return {
+        "Action": action,
+        "ResourceRecordSet": {
+            "Name": name,
+            "Type": "A",
+            "TTL": 300,
+            "ResourceRecords": [{"Value": ip}],
+        },
+    }
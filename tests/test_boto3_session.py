@@ -1,5 +1,6 @@
 """Tests for SessionManager class."""
 
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -118,6 +119,19 @@ class TestSessionManager:
         }
         assert result == expected
 
+    @patch("boto3.Session")
+    def test_get_credentials_resolved_once(self, mock_session: MagicMock) -> None:
+        """Test the credential provider chain is walked only once."""
+        mock_instance = MagicMock()
+        mock_instance.get_credentials.return_value.access_key = "AKIA1234TEST890"
+        mock_session.return_value = mock_instance
+
+        session_manager = SessionManager()
+        first = session_manager.get_credentials()
+
+        assert session_manager.get_credentials() == first
+        mock_instance.get_credentials.assert_called_once_with()
+
     @patch("boto3.Session")
     def test_get_credentials_no_credentials(self, mock_session: MagicMock) -> None:
         """Test credential information retrieval with no credentials."""
@@ -127,3 +141,44 @@ class TestSessionManager:
 
         with pytest.raises(Route53Error, match="Failed to get AWS credentials"):
             SessionManager().get_credentials()
+
+    @patch("boto3.Session")
+    def test_get_route53_client(self, mock_session: MagicMock) -> None:
+        """Test the Route 53 client uses the pooled config and is reused."""
+        mock_instance = MagicMock()
+        mock_session.return_value = mock_instance
+
+        session_manager = SessionManager(max_pool_connections=20)
+        client = session_manager.get_route53_client()
+
+        assert session_manager.get_route53_client() is client
+        mock_instance.client.assert_called_once_with(
+            "route53", config=session_manager.client_config
+        )
+        # botocore's stubs do not declare Config's options as attributes
+        config: Any = session_manager.client_config
+        assert config.max_pool_connections == 20
+        assert config.tcp_keepalive is True
+        assert config.retries == {"max_attempts": 3, "mode": "standard"}
+
+    @patch("boto3.Session")
+    def test_get_client_cached_per_service(self, mock_session: MagicMock) -> None:
+        """Test clients are created once per service."""
+        mock_instance = MagicMock()
+        mock_instance.client.side_effect = lambda name, config: MagicMock(name=name)
+        mock_session.return_value = mock_instance
+
+        session_manager = SessionManager()
+        route53 = session_manager.get_client("route53")
+
+        assert session_manager.get_route53_client() is route53
+        assert session_manager.get_client("sts") is not route53
+        assert mock_instance.client.call_count == 2
+
+    @patch("boto3.Session")
+    def test_get_client_error(self, mock_session: MagicMock) -> None:
+        """Test client creation errors are wrapped."""
+        mock_session.return_value.client.side_effect = ValueError("boom")
+
+        with pytest.raises(Route53Error, match="Failed to create route53 client"):
+            SessionManager().get_route53_client()
@@ -0,0 +1,133 @@
+"""Tests for the command line interface."""
+
+from typing import Any, Type
+
+import pytest
+
+import cli
+from src.route53_operations import Route53Operations
+
+
+@pytest.fixture
+def operations(route53_client: Any, monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Point the CLI at the mocked client and keep it from writing log files."""
+    operations = Route53Operations(route53_client)
+    monkeypatch.setattr(cli, "create_operations", lambda *args: operations)
+    monkeypatch.setattr(cli, "setup_cli_logging", lambda verbose: None)
+    return operations
+
+
+class TestCli:
+    """Test cases for the CLI commands."""
+
+    def test_list_records(
+        self,
+        operations: Route53Operations,
+        hosted_zone: str,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test list-records prints each record and then the record count."""
+        operations.create_dns_record(
+            hosted_zone_id=hosted_zone,
+            domain="example.com",
+            load_balancer_ip="192.168.1.100",
+            services=["api"],
+        )
+        records = operations.list_records(hosted_zone)
+
+        cli.main(["list-records", hosted_zone])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[:-1] == [cli.format_record(record) for record in records]
+        assert lines[-1] == f"Found {len(records)} records in zone {hosted_zone}"
+        assert any("api.example.com." in line for line in lines[:-1])
+
+    def test_check_changes(
+        self,
+        operations: Route53Operations,
+        hosted_zone: str,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test check-changes reports each change once, duplicates dropped."""
+        change_id = str(
+            operations.create_dns_record(
+                hosted_zone_id=hosted_zone,
+                domain="example.com",
+                load_balancer_ip="192.168.1.100",
+                services=["api"],
+            )
+        )
+
+        cli.main(["check-changes", "--wait", change_id, change_id])
+
+        assert capsys.readouterr().out == (
+            f"Change {change_id} status: INSYNC\n"
+            "✅ All changes have been propagated successfully!\n"
+        )
+
+    def test_shell(
+        self,
+        operations: Route53Operations,
+        hosted_zone: str,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the shell runs commands and survives bad input until exit."""
+        change_id = str(
+            operations.create_dns_record(
+                hosted_zone_id=hosted_zone,
+                domain="example.com",
+                load_balancer_ip="192.168.1.100",
+                services=["api"],
+            )
+        )
+        lines = iter(["", "bogus", "check-change", f"check-change {change_id}", "exit"])
+        monkeypatch.setattr("builtins.input", lambda prompt: next(lines))
+
+        cli.main(["shell"])
+
+        captured = capsys.readouterr()
+        assert f"Change {change_id} status: INSYNC" in captured.out
+        assert "Commands: list-records" in captured.out
+        assert "Unknown command: bogus" in captured.err
+        # The argument error from the bare check-change did not end the shell
+        assert "the following arguments are required: change_id" in captured.err
+
+    def test_shell_reports_unbalanced_quotes(
+        self,
+        operations: Route53Operations,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a line shlex cannot split is reported and the shell goes on."""
+        lines = iter(["list-records 'Z123", "help", "exit"])
+        monkeypatch.setattr("builtins.input", lambda prompt: next(lines))
+
+        cli.main(["shell"])
+
+        captured = capsys.readouterr()
+        assert "Error: No closing quotation" in captured.err
+        assert "Commands: list-records" in captured.out
+
+    @pytest.mark.parametrize("error", [EOFError, KeyboardInterrupt])
+    def test_shell_exits_on_eof_and_interrupt(
+        self,
+        operations: Route53Operations,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+        error: Type[BaseException],
+    ) -> None:
+        """Test Ctrl-D and Ctrl-C at the prompt end the shell cleanly."""
+
+        def interrupted(prompt: str) -> str:
+            raise error
+
+        monkeypatch.setattr("builtins.input", interrupted)
+
+        cli.main(["shell"])
+
+        assert capsys.readouterr().out.endswith("\n")
+
+    def test_parser_is_built_once(self) -> None:
+        """Test repeated main() calls reuse the cached top-level parser."""
+        assert cli._build_parser() is cli._build_parser()
@@ -0,0 +1,122 @@
+"""Tests for the asynchronous CLI helpers."""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+
+import cli_async
+from cli import format_record, format_records_by_zone
+from src.utils.error_handling import Route53ValidationError
+from src.utils.rate_limiter import RateLimiter, set_rate_limiter
+
+ZONE_ID = "Z1234567890123"
+
+
+class FakePaginator:
+    """Stand-in for an aioboto3 paginator serving fixed pages per zone."""
+
+    def __init__(self, pages: Dict[str, List[Dict[str, Any]]]) -> None:
+        self.pages = pages
+
+    async def _iterate(self, zone_id: str) -> AsyncIterator[Dict[str, Any]]:
+        for page in self.pages[zone_id]:
+            yield page
+
+    def paginate(self, HostedZoneId: str) -> AsyncIterator[Dict[str, Any]]:
+        return self._iterate(HostedZoneId)
+
+
+class FakeClient:
+    """Stand-in for an aioboto3 Route 53 client."""
+
+    def __init__(self, pages: Dict[str, List[Dict[str, Any]]]) -> None:
+        self.pages = pages
+
+    async def get_change(self, Id: str) -> Dict[str, Any]:
+        return {"ChangeInfo": {"Id": Id, "Status": "INSYNC"}}
+
+    def get_paginator(self, operation: str) -> FakePaginator:
+        assert operation == "list_resource_record_sets"
+        return FakePaginator(self.pages)
+
+
+def _record(name: str) -> Dict[str, Any]:
+    return {"Name": name, "Type": "A", "ResourceRecords": [{"Value": "10.0.0.1"}]}
+
+
+def test_check_changes() -> None:
+    """Test every change's status is returned, keyed by change ID."""
+    change_ids = ["/change/C1", "/change/C2"]
+
+    statuses = asyncio.run(cli_async.check_changes(FakeClient({}), change_ids))
+
+    assert statuses == {"/change/C1": "INSYNC", "/change/C2": "INSYNC"}
+
+
+def test_list_records_many_follows_pages() -> None:
+    """Test records from every page of every zone are collected."""
+    pages = {
+        ZONE_ID: [
+            {"ResourceRecordSets": [_record("a.example.com.")], "IsTruncated": True},
+            {"ResourceRecordSets": [_record("b.example.com.")], "IsTruncated": False},
+        ],
+        "Z0987654321": [{"ResourceRecordSets": [], "IsTruncated": False}],
+    }
+
+    results = asyncio.run(
+        cli_async.list_records_many(FakeClient(pages), [ZONE_ID, "Z0987654321"])
+    )
+
+    assert [r["Name"] for r in results[ZONE_ID]] == ["a.example.com.", "b.example.com."]
+    assert results["Z0987654321"] == []
+
+
+def test_list_records_many_invalid_zone_id() -> None:
+    """Test zone IDs are validated before any call is made."""
+    with pytest.raises(Route53ValidationError):
+        asyncio.run(cli_async.list_records_many(FakeClient({}), ["invalid-zone"]))
+
+
+def test_calls_take_rate_limiter_tokens() -> None:
+    """Test each API call, including every extra page, takes one token."""
+    # fast_rate_limiters puts the original limiter back afterwards
+    bucket = RateLimiter(max_calls=1, time_window=60.0, bucket_size=10)
+    set_rate_limiter("route53", bucket)
+    pages = {
+        ZONE_ID: [
+            {"ResourceRecordSets": [], "IsTruncated": True},
+            {"ResourceRecordSets": [], "IsTruncated": False},
+        ]
+    }
+    client = FakeClient(pages)
+
+    asyncio.run(cli_async.check_changes(client, ["/change/C1", "/change/C2"]))
+    asyncio.run(cli_async.list_records_many(client, [ZONE_ID]))
+
+    # Two get_change calls and two pages
+    assert 5.9 < bucket.tokens < 6.1
+
+
+def test_empty_bucket_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a call is rejected once the bucket stays empty past the timeout."""
+    bucket = RateLimiter(max_calls=1, time_window=60.0)
+    set_rate_limiter("route53", bucket)
+    monkeypatch.setattr(cli_async, "RATE_LIMIT_TIMEOUT", 0.01)
+    assert bucket.acquire() is True
+
+    with pytest.raises(TimeoutError, match="Rate limiter timeout"):
+        asyncio.run(cli_async.check_changes(FakeClient({}), ["/change/C1"]))
+
+
+def test_format_records_by_zone() -> None:
+    """Test the multi-zone listing matches the per-record format."""
+    record = _record("a.example.com.")
+
+    output = format_records_by_zone({ZONE_ID: [record], "Z0987654321": []})
+
+    assert output == (
+        f"Found 1 records in zone {ZONE_ID}:\n"
+        f"{format_record(record)}\n"
+        "Found 0 records in zone Z0987654321:\n"
+    )
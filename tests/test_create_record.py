@@ -1,36 +1,181 @@
 # tests/test_route53_operations.py
-from typing import Any
+from typing import Any, Dict
 
-import boto3
 import pytest
-from moto import mock_aws
+from helpers import a_record_change
 
+from src import route53_operations
 from src.route53_operations import Route53Operations
+from src.utils.error_handling import Route53ValidationError
+from src.utils.rate_limiter import AdaptiveRateLimiter, RateLimiter, set_rate_limiter
 
 
-@pytest.fixture
-def route53_client() -> Any:
-    with mock_aws():
-        session = boto3.Session(region_name="us-east-1")
-        yield session.client("route53")
-
-
-def test_create_dns_records(route53_client: Any) -> None:
+def test_create_dns_records(route53_client: Any, hosted_zone: str) -> None:
     operations = Route53Operations(route53_client)
-    hosted_zone = route53_client.create_hosted_zone(
-        Name="example.com", CallerReference="test"
-    )
-    zone_id = hosted_zone["HostedZone"]["Id"].split("/")[-1]
 
     operations.create_dns_record(
-        hosted_zone_id=zone_id,
+        hosted_zone_id=hosted_zone,
         domain="example.com",
         load_balancer_ip="192.168.1.100",
         services=["api"],
     )
 
-    records = route53_client.list_resource_record_sets(HostedZoneId=zone_id)
-    assert any(
-        r["Name"] == "api.example.com." and r["Type"] == "A"
-        for r in records["ResourceRecordSets"]
+    records = route53_client.list_resource_record_sets(HostedZoneId=hosted_zone)
+    names = {(r["Name"], r["Type"]) for r in records["ResourceRecordSets"]}
+    assert ("api.example.com.", "A") in names
+
+
+def test_create_dns_record_rejects_invalid_ip(
+    route53_client: Any, hosted_zone: str
+) -> None:
+    operations = Route53Operations(route53_client)
+
+    for ip in ("192.168.1.300", "2001:db8::1"):
+        with pytest.raises(Route53ValidationError):
+            operations.create_dns_record(
+                hosted_zone_id=hosted_zone,
+                domain="example.com",
+                load_balancer_ip=ip,
+                services=["api"],
+            )
+
+
+def test_create_dns_record_tracks_every_batch(
+    route53_client: Any, hosted_zone: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    operations = Route53Operations(route53_client)
+    # Room for one UPSERT per batch
+    monkeypatch.setattr("src.route53_operations.MAX_CHANGES_PER_BATCH", 2)
+
+    change = operations.create_dns_record(
+        hosted_zone_id=hosted_zone,
+        domain="example.com",
+        load_balancer_ip="192.168.1.100",
+        services=["api", "web", "admin"],
+    )
+
+    # moto reuses one change ID, so only the count can be checked
+    assert len(change.ids) == 3
+    assert change.id == change.ids[-1]
+    assert change.status() == "INSYNC"
+    assert change.wait() == "INSYNC"
+
+
+def test_submit_change_batch_chunks_changes(
+    route53_client: Any, hosted_zone: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    operations = Route53Operations(route53_client)
+    monkeypatch.setattr("src.route53_operations.MAX_CHANGES_PER_BATCH", 2)
+
+    changes = [
+        a_record_change(f"{service}.example.com.", "192.168.1.100")
+        for service in ("api", "web", "admin")
+    ]
+    change_ids = operations.submit_change_batch(hosted_zone, changes)
+
+    assert len(change_ids) == 2
+    records = route53_client.list_resource_record_sets(HostedZoneId=hosted_zone)
+    names = {r["Name"] for r in records["ResourceRecordSets"] if r["Type"] == "A"}
+    assert names == {"api.example.com.", "web.example.com.", "admin.example.com."}
+
+
+def test_submit_change_batch_paces_every_call(
+    route53_client: Any, hosted_zone: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    operations = Route53Operations(route53_client)
+    monkeypatch.setattr("src.route53_operations.MAX_CHANGES_PER_BATCH", 1)
+    # fast_rate_limiters puts the original limiter back afterwards
+    bucket = RateLimiter(max_calls=1, time_window=60.0, bucket_size=5)
+    set_rate_limiter("route53", bucket)
+    adaptive = AdaptiveRateLimiter(initial_rate=1_000_000.0, max_rate=1_000_000.0)
+    set_rate_limiter("route53_adaptive", adaptive)
+
+    changes = [
+        a_record_change(f"{service}.example.com.", "192.168.1.100")
+        for service in ("api", "web", "admin")
+    ]
+
+    assert len(operations.submit_change_batch(hosted_zone, changes)) == 3
+    # The decorator pays for the first call and the other two are reserved
+    # together, so every ChangeResourceRecordSets call takes a token
+    assert 1.9 < bucket.tokens < 2.1
+    assert adaptive.success_count == 1
+
+
+def test_submit_change_batch_halves_batches_with_upserts(
+    route53_client: Any, hosted_zone: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    operations = Route53Operations(route53_client)
+    monkeypatch.setattr("src.route53_operations.MAX_CHANGES_PER_BATCH", 4)
+
+    changes = [
+        a_record_change(f"{service}.example.com.", "192.168.1.100", "UPSERT")
+        for service in ("api", "web", "admin")
+    ]
+
+    assert len(operations.submit_change_batch(hosted_zone, changes)) == 2
+
+
+def test_submit_change_batch_drops_duplicate_changes(
+    route53_client: Any, hosted_zone: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    operations = Route53Operations(route53_client)
+
+    change = a_record_change("api.example.com.", "192.168.1.100", "UPSERT")
+    record_set: Dict[str, Any] = change["ResourceRecordSet"]
+    reordered = {
+        "ResourceRecordSet": dict(reversed(record_set.items())),
+        "Action": "UPSERT",
+    }
+    sent = []
+    original = route53_client.change_resource_record_sets
+
+    def spy(**kwargs: Any) -> Any:
+        sent.extend(kwargs["ChangeBatch"]["Changes"])
+        return original(**kwargs)
+
+    monkeypatch.setattr(route53_client, "change_resource_record_sets", spy)
+    operations.submit_change_batch(hosted_zone, [change, reordered, change])
+
+    assert sent == [change]
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_change_key_ignores_key_order(backend: str) -> None:
+    if backend == "orjson":
+        # With the "fast" extra installed, _change_key is the orjson one
+        pytest.importorskip("orjson")
+        change_key = route53_operations._change_key
+    else:
+        change_key = route53_operations._json_change_key
+
+    change = a_record_change("api.example.com.", "192.168.1.100")
+    reordered = dict(reversed(change.items()))
+
+    assert change_key(change) == change_key(reordered)
+    assert change_key(change) != change_key(
+        a_record_change("api.example.com.", "192.168.1.101")
     )
+
+
+def test_submit_change_batches_updates_several_zones(route53_client: Any) -> None:
+    operations = Route53Operations(route53_client)
+    zone_ids = [
+        route53_client.create_hosted_zone(
+            Name=f"{name}.com", CallerReference=f"test-{name}"
+        )["HostedZone"]["Id"].split("/")[-1]
+        for name in ("first", "second")
+    ]
+    changes_by_zone = {
+        zone_id: [a_record_change(f"api.{name}.com.", "192.168.1.100")]
+        for zone_id, name in zip(zone_ids, ("first", "second"))
+    }
+
+    results = operations.submit_change_batches(changes_by_zone)
+
+    assert list(results) == zone_ids
+    assert all(len(change_ids) == 1 for change_ids in results.values())
+    for zone_id, name in zip(zone_ids, ("first", "second")):
+        records = route53_client.list_resource_record_sets(HostedZoneId=zone_id)
+        names = {r["Name"] for r in records["ResourceRecordSets"]}
+        assert f"api.{name}.com." in names
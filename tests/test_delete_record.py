@@ -1,32 +1,13 @@
 """Tests for Route53Operations delete functionality."""
 
-from typing import Any
+from typing import Any, Dict, Iterator
 
-import boto3
 import pytest
-from moto import mock_aws
 
 from src.route53_operations import Route53Operations
 from src.utils.error_handling import Route53NotFoundError, Route53ValidationError
 
 
-@pytest.fixture
-def route53_client() -> Any:
-    """Provide a mocked Route53 client."""
-    with mock_aws():
-        session = boto3.Session(region_name="us-east-1")
-        yield session.client("route53")
-
-
-@pytest.fixture
-def hosted_zone(route53_client: Any) -> str:
-    """Create a test hosted zone."""
-    hosted_zone = route53_client.create_hosted_zone(
-        Name="example.com", CallerReference="test-delete"
-    )
-    return str(hosted_zone["HostedZone"]["Id"].split("/")[-1])
-
-
 class TestRoute53OperationsDelete:
     """Test cases for Route53Operations delete functionality."""
 
@@ -46,38 +27,26 @@ class TestRoute53OperationsDelete:
 
         # Verify records exist
         records = route53_client.list_resource_record_sets(HostedZoneId=hosted_zone)
-        api_record_exists = any(
-            r["Name"] == "api.example.com." and r["Type"] == "A"
-            for r in records["ResourceRecordSets"]
-        )
-        web_record_exists = any(
-            r["Name"] == "web.example.com." and r["Type"] == "A"
-            for r in records["ResourceRecordSets"]
-        )
-        assert api_record_exists
-        assert web_record_exists
+        names = {(r["Name"], r["Type"]) for r in records["ResourceRecordSets"]}
+        assert ("api.example.com.", "A") in names
+        assert ("web.example.com.", "A") in names
 
         # Delete the records
         change_id = operations.delete_dns_records(
             hosted_zone_id=hosted_zone, domain="example.com", services=["api", "web"]
         )
 
-        assert change_id.startswith("/change/")
+        assert str(change_id).startswith("/change/")
 
         # Verify records are deleted
         records_after = route53_client.list_resource_record_sets(
             HostedZoneId=hosted_zone
         )
-        api_record_exists_after = any(
-            r["Name"] == "api.example.com." and r["Type"] == "A"
-            for r in records_after["ResourceRecordSets"]
-        )
-        web_record_exists_after = any(
-            r["Name"] == "web.example.com." and r["Type"] == "A"
-            for r in records_after["ResourceRecordSets"]
-        )
-        assert not api_record_exists_after
-        assert not web_record_exists_after
+        names_after = {
+            (r["Name"], r["Type"]) for r in records_after["ResourceRecordSets"]
+        }
+        assert ("api.example.com.", "A") not in names_after
+        assert ("web.example.com.", "A") not in names_after
 
     def test_delete_dns_records_partial_success(
         self, route53_client: Any, hosted_zone: str
@@ -100,7 +69,7 @@ class TestRoute53OperationsDelete:
             services=["api", "nonexistent"],
         )
 
-        assert change_id.startswith("/change/")
+        assert str(change_id).startswith("/change/")
 
     def test_delete_dns_records_invalid_zone_id(self, route53_client: Any) -> None:
         """Test deletion with invalid hosted zone ID."""
@@ -145,3 +114,81 @@ class TestRoute53OperationsDelete:
                 domain="example.com",
                 services=["api"],
             )
+
+    def test_delete_dns_records_ignores_case(
+        self, route53_client: Any, hosted_zone: str
+    ) -> None:
+        """Test service names match records regardless of case."""
+        operations = Route53Operations(route53_client)
+        operations.create_dns_record(
+            hosted_zone_id=hosted_zone,
+            domain="example.com",
+            load_balancer_ip="192.168.1.100",
+            services=["api"],
+        )
+
+        operations.delete_dns_records(
+            hosted_zone_id=hosted_zone, domain="Example.COM", services=["API"]
+        )
+
+        records = route53_client.list_resource_record_sets(HostedZoneId=hosted_zone)
+        assert "A" not in {r["Type"] for r in records["ResourceRecordSets"]}
+
+    def test_delete_dns_records_wildcard(
+        self, route53_client: Any, hosted_zone: str
+    ) -> None:
+        """Test a wildcard record is found and deleted."""
+        operations = Route53Operations(route53_client)
+        operations.create_dns_record(
+            hosted_zone_id=hosted_zone,
+            domain="example.com",
+            load_balancer_ip="192.168.1.100",
+            services=["*", "api"],
+        )
+
+        operations.delete_dns_records(
+            hosted_zone_id=hosted_zone, domain="example.com", services=["*"]
+        )
+
+        records = route53_client.list_resource_record_sets(HostedZoneId=hosted_zone)
+        names = {r["Name"] for r in records["ResourceRecordSets"] if r["Type"] == "A"}
+        assert names == {"api.example.com."}
+
+    def test_delete_dns_records_matches_escaped_wildcard(
+        self, route53_client: Any, hosted_zone: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test names Route 53 returns with ``*`` escaped as ``\\052`` match."""
+        operations = Route53Operations(route53_client)
+        record_set = {
+            "Name": "\\052.example.com.",
+            "Type": "A",
+            "TTL": 300,
+            "ResourceRecords": [{"Value": "192.168.1.100"}],
+        }
+        other = dict(record_set, Name="api.example.com.")
+        listings = []
+        submitted = []
+
+        class Paginator:
+            def paginate(self, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+                listings.append(kwargs)
+                return iter([{"ResourceRecordSets": [record_set, other]}])
+
+        def change_resource_record_sets(**kwargs: Any) -> Dict[str, Any]:
+            submitted.extend(kwargs["ChangeBatch"]["Changes"])
+            return {"ChangeInfo": {"Id": "/change/C123", "Status": "PENDING"}}
+
+        monkeypatch.setattr(route53_client, "get_paginator", lambda name: Paginator())
+        monkeypatch.setattr(
+            route53_client, "change_resource_record_sets", change_resource_record_sets
+        )
+
+        operations.delete_dns_records(
+            hosted_zone_id=hosted_zone, domain="example.com", services=["*"]
+        )
+
+        # The zone is listed once, and only the wildcard record is deleted
+        assert listings == [
+            {"HostedZoneId": hosted_zone, "PaginationConfig": {"PageSize": 300}}
+        ]
+        assert submitted == [{"Action": "DELETE", "ResourceRecordSet": record_set}]
@@ -1,5 +1,7 @@
 """Tests for error handling utilities."""
 
+from typing import Type
+
 import pytest
 from botocore.exceptions import ClientError
 
@@ -12,6 +14,7 @@ from src.utils.error_handling import (
     handle_aws_errors,
     validate_domain_name,
     validate_hosted_zone_id,
+    validate_ip_address,
 )
 
 
@@ -62,85 +65,84 @@ class TestHandleAwsErrors:
         result = successful_function()
         assert result == "success"
 
-    def test_handle_aws_errors_client_error_not_found(self) -> None:
-        """Test decorator with NoSuchHostedZone error."""
-
-        @handle_aws_errors()
-        def failing_function() -> None:
-            raise ClientError(
-                {"Error": {"Code": "NoSuchHostedZone", "Message": "Zone not found"}},
+    def test_handle_aws_errors_reuses_decorator(self) -> None:
+        """Test the decorator is built once per set of arguments."""
+        assert handle_aws_errors() is handle_aws_errors()
+        assert handle_aws_errors(reraise_as=Route53ThrottleError) is not (
+            handle_aws_errors()
+        )
+
+    @pytest.mark.parametrize(
+        "code,message,operation,error_class",
+        [
+            (
+                "NoSuchHostedZone",
+                "Zone not found",
                 "ListResourceRecordSets",
-            )
-
-        with pytest.raises(Route53NotFoundError, match="Zone not found"):
-            failing_function()
-
-    def test_handle_aws_errors_client_error_invalid_input(self) -> None:
-        """Test decorator with InvalidInput error."""
-
-        @handle_aws_errors()
-        def failing_function() -> None:
-            raise ClientError(
-                {"Error": {"Code": "InvalidInput", "Message": "Invalid parameter"}},
+                Route53NotFoundError,
+            ),
+            (
+                "InvalidInput",
+                "Invalid parameter",
                 "ChangeResourceRecordSets",
-            )
-
-        with pytest.raises(Route53ValidationError, match="Invalid parameter"):
-            failing_function()
-
-    def test_handle_aws_errors_client_error_access_denied(self) -> None:
-        """Test decorator with AccessDenied error."""
-
-        @handle_aws_errors()
-        def failing_function() -> None:
-            raise ClientError(
-                {"Error": {"Code": "AccessDenied", "Message": "Access denied"}},
+                Route53ValidationError,
+            ),
+            (
+                "AccessDenied",
+                "Access denied",
                 "CreateHostedZone",
-            )
-
-        with pytest.raises(Route53PermissionError, match="Access denied"):
-            failing_function()
-
-    def test_handle_aws_errors_client_error_throttling(self) -> None:
-        """Test decorator with Throttling error."""
+                Route53PermissionError,
+            ),
+            (
+                "Throttling",
+                "Rate exceeded",
+                "ChangeResourceRecordSets",
+                Route53ThrottleError,
+            ),
+        ],
+    )
+    def test_handle_aws_errors_client_error_mapping(
+        self,
+        code: str,
+        message: str,
+        operation: str,
+        error_class: Type[Route53Error],
+    ) -> None:
+        """Test decorator maps AWS error codes to Route53Error subclasses."""
+        error = ClientError({"Error": {"Code": code, "Message": message}}, operation)
 
         @handle_aws_errors()
         def failing_function() -> None:
-            raise ClientError(
-                {"Error": {"Code": "Throttling", "Message": "Rate exceeded"}},
-                "ChangeResourceRecordSets",
-            )
+            raise error
 
-        with pytest.raises(Route53ThrottleError, match="Rate exceeded"):
+        with pytest.raises(error_class, match=message):
             failing_function()
 
 
 class TestValidationFunctions:
     """Test validation utility functions."""
 
-    def test_validate_hosted_zone_id_valid(self) -> None:
+    @pytest.mark.parametrize(
+        "zone_id", ["Z1234567890123", "Z1A2B3C4D5E6F7", "ZABCDEFGHIJKLMN"]
+    )
+    def test_validate_hosted_zone_id_valid(self, zone_id: str) -> None:
         """Test validation of valid hosted zone IDs."""
-        valid_ids = [
-            "Z1234567890123",
-            "Z1A2B3C4D5E6F7",
-            "ZABCDEFGHIJKLMN",
-        ]
-
-        for zone_id in valid_ids:
-            validate_hosted_zone_id(zone_id)  # Should not raise
+        validate_hosted_zone_id(zone_id)  # Should not raise
 
-    def test_validate_hosted_zone_id_invalid(self) -> None:
-        """Test validation of invalid hosted zone IDs."""
-        invalid_ids = [
+    @pytest.mark.parametrize(
+        "zone_id",
+        [
             "",  # Empty
             "1234567",  # Too short
             "Z123456$",  # Invalid character
             "a" * 33,  # Too long
-        ]
-
-        for zone_id in invalid_ids:
-            with pytest.raises(Route53ValidationError):
-                validate_hosted_zone_id(zone_id)
+            "Z123456789\u00e9",  # Alphanumeric, but not ASCII
+        ],
+    )
+    def test_validate_hosted_zone_id_invalid(self, zone_id: str) -> None:
+        """Test validation of invalid hosted zone IDs."""
+        with pytest.raises(Route53ValidationError):
+            validate_hosted_zone_id(zone_id)
 
     def test_validate_hosted_zone_id_prefix_removal(self) -> None:
         """Test removal of /hostedzone/ prefix."""
@@ -148,38 +150,73 @@ class TestValidationFunctions:
         result = validate_hosted_zone_id(zone_id_with_prefix)
         assert result == "Z1234567890123"
 
-    def test_validate_domain_name_valid(self) -> None:
-        """Test validation of valid domain names."""
-        valid_domains = [
+    def test_validate_hosted_zone_id_cached(self) -> None:
+        """Test repeated validations are served from the cache."""
+        validate_hosted_zone_id.cache_clear()
+        for _ in range(3):
+            validate_hosted_zone_id("Z1234567890123")
+
+        with pytest.raises(Route53ValidationError):
+            validate_hosted_zone_id("Z123456$")
+        with pytest.raises(Route53ValidationError):
+            validate_hosted_zone_id("Z123456$")
+
+        info = validate_hosted_zone_id.cache_info()
+        assert (info.hits, info.currsize) == (2, 1)
+
+    @pytest.mark.parametrize(
+        "domain",
+        [
             "example.com",
             "subdomain.example.com",
             "test-domain.org",
             "a.b.c.d.com",
             "123.example.com",
-        ]
-
-        for domain in valid_domains:
-            validate_domain_name(domain)  # Should not raise
+        ],
+    )
+    def test_validate_domain_name_valid(self, domain: str) -> None:
+        """Test validation of valid domain names."""
+        validate_domain_name(domain)  # Should not raise
 
-    def test_validate_domain_name_invalid(self) -> None:
-        """Test validation of invalid domain names."""
-        invalid_domains = [
+    @pytest.mark.parametrize(
+        "domain",
+        [
             "",  # Empty
             "a" * 254,  # Too long
-        ]
-
-        for domain in invalid_domains:
-            with pytest.raises(Route53ValidationError):
-                validate_domain_name(domain)
+            "a." * 5000,  # Far too long; rejected before the regex runs
+            "a" * 64 + ".com",  # Label too long
+            "example..com",  # Empty label
+            "exa mple.com",  # Invalid character
+        ],
+    )
+    def test_validate_domain_name_invalid(self, domain: str) -> None:
+        """Test validation of invalid domain names."""
+        with pytest.raises(Route53ValidationError):
+            validate_domain_name(domain)
 
-    def test_validate_domain_name_normalization(self) -> None:
-        """Test domain name normalization (adding trailing dot)."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "input_domain,expected",
+        [
             ("example.com", "example.com."),
             ("sub.example.org", "sub.example.org."),
             ("test.co.uk", "test.co.uk."),
-        ]
+        ],
+    )
+    def test_validate_domain_name_normalization(
+        self, input_domain: str, expected: str
+    ) -> None:
+        """Test domain name normalization (adding trailing dot)."""
+        assert validate_domain_name(input_domain) == expected
+
+    def test_validate_ip_address(self) -> None:
+        """Test validation and normalization of IP addresses."""
+        assert validate_ip_address(" 10.0.0.1 ") == "10.0.0.1"
+        assert validate_ip_address("2001:DB8::1") == "2001:db8::1"
+        assert validate_ip_address("10.0.0.1", version=4) == "10.0.0.1"
+
+        for invalid_ip in ["", "10.0.0.256", "not-an-ip"]:
+            with pytest.raises(Route53ValidationError, match="Invalid IP address"):
+                validate_ip_address(invalid_ip)
 
-        for input_domain, expected in test_cases:
-            result = validate_domain_name(input_domain)
-            assert result == expected
+        with pytest.raises(Route53ValidationError, match="Expected an IPv4"):
+            validate_ip_address("2001:db8::1", version=4)
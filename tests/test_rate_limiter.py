@@ -1,11 +1,58 @@
 """Tests for rate limiting utilities."""
 
+import threading
 import time
-from typing import Optional
+from types import SimpleNamespace
+from typing import Any, List, Optional
 
 import pytest
+from botocore.exceptions import ClientError
 
-from src.utils.rate_limiter import RateLimiter, rate_limit
+from src.utils import rate_limiter
+from src.utils.error_handling import Route53ThrottleError, handle_aws_errors
+from src.utils.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    rate_limit,
+    reserve_tokens,
+    set_rate_limiter,
+)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """
+    Run limiters created in the test on a simulated clock.
+
+    Sleeping and waiting on a bucket's condition just advance the clock, so
+    nothing blocks in real time and an empty bucket cannot hang the test.
+    """
+    now = [1000.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    class FakeCondition(threading.Condition):
+        def wait(self, timeout: Optional[float] = None) -> bool:
+            assert timeout is not None, "an untimed wait would never return"
+            sleep(timeout)
+            return False
+
+    monkeypatch.setattr(
+        rate_limiter,
+        "time",
+        SimpleNamespace(
+            monotonic=lambda: now[0],
+            monotonic_ns=lambda: round(now[0] * 1e9),
+            sleep=sleep,
+        ),
+    )
+    monkeypatch.setattr(
+        rate_limiter,
+        "threading",
+        SimpleNamespace(Lock=threading.Lock, Condition=FakeCondition),
+    )
+    return now
 
 
 class TestRateLimiter:
@@ -21,10 +68,6 @@ class TestRateLimiter:
         # Test wait_for_tokens method exists and works
         assert limiter.wait_for_tokens() is True
 
-
-class RateLimiterTest:
-    """Tests for RateLimiter class."""
-
     def test_create_rate_limiter(self) -> None:
         """Test creation of a rate limiter."""
         limiter = RateLimiter(max_calls=5, time_window=1.0)
@@ -32,6 +75,96 @@ class RateLimiterTest:
         assert limiter.time_window == 1.0
         assert limiter.bucket_size == 5
 
+    def test_wait_for_tokens_refills_partial_tokens(self) -> None:
+        """Test that refills shorter than one token accumulate."""
+        limiter = RateLimiter(max_calls=5, time_window=1.0, bucket_size=1)
+
+        assert limiter.acquire() is True
+        assert limiter.acquire() is False
+
+        # Polls add less than a whole token each; they must still add up
+        assert limiter.wait_for_tokens(timeout=1.0) is True
+
+    def test_full_bucket_grants_every_token(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a full bucket hands out exactly bucket_size tokens at one instant."""
+        # Freeze the limiter's clock so no time passes between the takes
+        monkeypatch.setattr(
+            rate_limiter, "time", SimpleNamespace(monotonic_ns=lambda: 1000 * 10**9)
+        )
+        limiter = RateLimiter(max_calls=5, time_window=1.0)
+
+        assert [limiter.acquire() for _ in range(6)] == [True] * 5 + [False]
+
+    def test_idle_bucket_caps_at_bucket_size(self) -> None:
+        """Test that a long idle period does not allow a burst above the cap."""
+        limiter = RateLimiter(max_calls=5, time_window=1.0, bucket_size=3)
+        limiter.zero_time -= 100 * 10**9  # as if idle for 100 seconds
+
+        assert limiter.tokens == 3
+        assert limiter.acquire(3) is True
+        assert limiter.acquire() is False
+
+
+class TestReserveTokens:
+    """Test reserving tokens for a batch of calls."""
+
+    def test_reservation_waits_a_bucket_at_a_time(
+        self, fake_clock: List[float]
+    ) -> None:
+        """Test a reservation larger than the bucket is served in full buckets."""
+        bucket = RateLimiter(max_calls=5, time_window=1.0, bucket_size=2)
+        set_rate_limiter("batch", bucket)
+
+        reserve_tokens(5, "batch")
+
+        # Two tokens were there; the other three took 0.6 seconds to refill
+        assert fake_clock[0] == pytest.approx(1000.6)
+        assert bucket.acquire() is False
+
+    def test_reservation_times_out(
+        self, fake_clock: List[float], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a reservation is rejected like a decorated call when starved."""
+        set_rate_limiter("batch", RateLimiter(max_calls=1, time_window=60.0))
+        monkeypatch.setattr(rate_limiter, "_BUCKET_TIMEOUT", 1.0)
+
+        with pytest.raises(TimeoutError, match="Rate limiter timeout"):
+            reserve_tokens(2, "batch")
+
+
+class TestAdaptiveRateLimiter:
+    """Test AdaptiveRateLimiter class."""
+
+    def test_wait_and_acquire_paces_concurrent_callers(self) -> None:
+        """Test that concurrent callers are spaced by the current interval."""
+        limiter = AdaptiveRateLimiter(initial_rate=20.0)
+        threads = [threading.Thread(target=limiter.wait_and_acquire) for _ in range(5)]
+
+        start = time.monotonic_ns()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # The first call is immediate, the other four wait 50ms each
+        assert time.monotonic_ns() - start >= 190_000_000
+
+    def test_rate_recovers_after_consecutive_successes(self) -> None:
+        """Test the rate rises every 5 successes and errors reset the streak."""
+        limiter = AdaptiveRateLimiter(initial_rate=2.0, recovery_factor=2.0)
+
+        for _ in range(5):
+            limiter.report_success()
+        assert limiter.current_rate == 4.0
+
+        limiter.report_error()
+        for _ in range(4):
+            limiter.report_success()
+        assert limiter.current_rate == 2.0
+        assert limiter.success_count == 4
+
 
 class TestRateLimitDecorator:
     """Test rate_limit decorator."""
@@ -45,17 +178,17 @@ class TestRateLimitDecorator:
 
         assert test_function() == "success"
 
-    def test_rate_limit_multiple_calls(self) -> None:
-        """Test multiple function calls with rate limiting."""
+    def test_rate_limit_multiple_calls(self, fake_clock: List[float]) -> None:
+        """Test successive adaptive calls are spaced by the current interval."""
+        set_rate_limiter("paced_adaptive", AdaptiveRateLimiter(initial_rate=10.0))
 
-        @rate_limit("route53")
+        @rate_limit("paced", adaptive=True)
         def test_function() -> float:
-            return time.time()
+            return fake_clock[0]
+
+        calls = [test_function() for _ in range(3)]
 
-        # Test that function executes
-        start_time = time.time()
-        first_call = test_function()
-        assert first_call >= start_time
+        assert calls == pytest.approx([1000.0, 1000.1, 1000.2])
 
     def test_rate_limit_exception_handling(self) -> None:
         """Test rate limiting with function that raises exception."""
@@ -77,14 +210,90 @@ class TestRateLimitDecorator:
         assert function_with_args(1, 2) == 3
         assert function_with_args(1, 2, 3) == 6
 
-    def test_rate_limit_burst_handling(self) -> None:
-        """Test burst handling in rate limiter."""
+    def test_rate_limit_burst_handling(self, fake_clock: List[float]) -> None:
+        """Test a full bucket allows a burst, then refills at the steady rate."""
+        bucket = RateLimiter(max_calls=5, time_window=1.0)
+        set_rate_limiter("burst", bucket)
 
-        @rate_limit("route53")
+        @rate_limit("burst")
         def test_function() -> float:
-            return time.time()
+            return fake_clock[0]
+
+        # The whole burst runs without any simulated time passing
+        assert [test_function() for _ in range(5)] == [1000.0] * 5
+        assert bucket.acquire() is False
+
+        # The next call waits for one token to refill
+        assert test_function() == pytest.approx(1000.2)
+
+    def test_adaptive_rate_limit_shares_token_bucket(self) -> None:
+        """Test adaptive calls draw from the regular bucket of the same name."""
+        bucket = RateLimiter(max_calls=5, time_window=1.0, bucket_size=2)
+        set_rate_limiter("shared", bucket)
+        set_rate_limiter("shared_adaptive", AdaptiveRateLimiter(initial_rate=100.0))
+
+        @rate_limit("shared", adaptive=True)
+        def test_function() -> str:
+            return "success"
+
+        test_function()
+        test_function()
+        assert bucket.acquire() is False
+
+    def test_rate_limit_picks_up_replaced_limiter(self) -> None:
+        """Test set_rate_limiter applies to functions decorated earlier."""
+        set_rate_limiter("swapped", RateLimiter(max_calls=100, time_window=1.0))
+
+        @rate_limit("swapped")
+        def test_function() -> str:
+            return "success"
+
+        test_function()
+        bucket = RateLimiter(max_calls=5, time_window=1.0, bucket_size=1)
+        set_rate_limiter("swapped", bucket)
+
+        test_function()
+        assert bucket.acquire() is False
+
+    def test_adaptive_rate_limit_classifies_errors_by_code(self) -> None:
+        """Test only throttling error codes count as throttles."""
+        limiter = AdaptiveRateLimiter(initial_rate=8.0)
+        set_rate_limiter("classify_adaptive", limiter)
+
+        @rate_limit("classify", adaptive=True)
+        def failing_function(code: str) -> None:
+            raise ClientError(
+                {"Error": {"Code": code, "Message": "Throttle me"}},
+                "ListResourceRecordSets",
+            )
+
+        with pytest.raises(ClientError):
+            failing_function("InvalidInput")
+        assert limiter.current_rate == 4.0
+
+        with pytest.raises(ClientError):
+            failing_function("Throttling")
+        assert limiter.current_rate == 1.0
+
+    def test_adaptive_rate_limit_honours_retry_after(self) -> None:
+        """Test PriorRequestNotComplete backs off for the Retry-After delay."""
+        limiter = AdaptiveRateLimiter(initial_rate=4.0)
+        set_rate_limiter("retry_adaptive", limiter)
+
+        # Real responses carry more metadata than the limiter reads
+        response: Any = {
+            "Error": {"Code": "PriorRequestNotComplete", "Message": "Busy"},
+            "ResponseMetadata": {"HTTPHeaders": {"retry-after": "0.2"}},
+        }
+
+        @rate_limit("retry", adaptive=True)
+        @handle_aws_errors()
+        def busy_function() -> None:
+            raise ClientError(response, "ChangeResourceRecordSets")
+
+        before = time.monotonic()
+        with pytest.raises(Route53ThrottleError):
+            busy_function()
 
-        # Test that function executes
-        start = time.time()
-        result = test_function()
-        assert result >= start
+        assert limiter.current_rate == 1.0
+        assert limiter.blocked_until >= before + 0.2
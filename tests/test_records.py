@@ -0,0 +1,179 @@
+"""Tests for the DNS record classes."""
+
+import dataclasses
+from typing import Any, Callable, Dict, Type
+
+import pytest
+
+from src.records import (
+    RECORD_TYPES,
+    AAAARecord,
+    AliasTarget,
+    ARecord,
+    CNAMERecord,
+    DnsRecord,
+    MXRecord,
+    TXTRecord,
+    _BaseRecord,
+    create_record,
+)
+
+ALIAS: AliasTarget = {
+    "HostedZoneId": "Z2FDTNDATAQYW2",
+    "DNSName": "d111111abcdef8.cloudfront.net.",
+    "EvaluateTargetHealth": False,
+}
+
+
+def test_records_with_equal_fields_are_equal() -> None:
+    """Test values are normalized before records are compared."""
+    record = ARecord(name="www.example.com.", values=[" 192.0.2.1 "])
+
+    assert record == ARecord(name="www.example.com.", values=("192.0.2.1",))
+    assert record != ARecord(name="www.example.com.", values=["192.0.2.2"])
+    assert record != ARecord(name="www.example.com.", values=["192.0.2.1"], ttl=60)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"values": ["192.0.2.1", "192.0.2.2"]},
+        {"alias_target": ALIAS},
+    ],
+)
+def test_records_are_hashable(kwargs: Any) -> None:
+    """Test equal records hash equal, so they can be deduplicated in sets."""
+    records = {ARecord(name="www.example.com.", **kwargs) for _ in range(3)}
+
+    assert len(records) == 1
+
+
+def test_records_are_immutable() -> None:
+    """Test fields cannot be reassigned once a record is created."""
+    record = MXRecord(name="example.com.", values=["10 mail.example.com"])
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        record.values = ("20 backup.example.com",)  # type: ignore[misc]
+
+
+def test_alias_target_is_copied() -> None:
+    """Test later changes to the caller's alias dict do not reach the record."""
+    alias = ALIAS.copy()
+    record = ARecord(name="www.example.com.", alias_target=alias)
+
+    alias["DNSName"] = "elsewhere.example.com."
+
+    assert record.get_record_set()["AliasTarget"] == ALIAS
+
+
+def test_record_set_is_built_once() -> None:
+    """Test the record set is cached and matches the Route 53 shape."""
+    record = TXTRecord(name="example.com.", values=["v=spf1 -all", '"quoted"'])
+
+    record_set = record.get_record_set()
+
+    assert record_set == {
+        "Name": "example.com.",
+        "Type": "TXT",
+        "TTL": 300,
+        "ResourceRecords": [{"Value": '"v=spf1 -all"'}, {"Value": '"quoted"'}],
+    }
+    assert record.get_record_set() is record_set
+
+
+@pytest.mark.parametrize("record_class", RECORD_TYPES.values())
+def test_record_types_define_record_set(record_class: Type[DnsRecord]) -> None:
+    """Test every record type overrides the base's _record_set stub."""
+    # Looked up on the class, each is the descriptor itself
+    assert getattr(record_class, "_record_set") is not _BaseRecord._record_set
+
+
+@pytest.mark.parametrize(
+    "record, expected",
+    [
+        (
+            ARecord(name="www.example.com.", values=["192.0.2.1"]),
+            {
+                "Name": "www.example.com.",
+                "Type": "A",
+                "TTL": 300,
+                "ResourceRecords": [{"Value": "192.0.2.1"}],
+            },
+        ),
+        (
+            ARecord(name="www.example.com.", alias_target=ALIAS),
+            {"Name": "www.example.com.", "Type": "A", "AliasTarget": ALIAS},
+        ),
+        (
+            AAAARecord(name="www.example.com.", values=["2001:db8::1"], ttl=60),
+            {
+                "Name": "www.example.com.",
+                "Type": "AAAA",
+                "TTL": 60,
+                "ResourceRecords": [{"Value": "2001:db8::1"}],
+            },
+        ),
+        (
+            CNAMERecord(name="docs.example.com.", values=[" www.example.com "]),
+            {
+                "Name": "docs.example.com.",
+                "Type": "CNAME",
+                "TTL": 300,
+                "ResourceRecords": [{"Value": "www.example.com"}],
+            },
+        ),
+        (
+            MXRecord(name="example.com.", values=["10 mail.example.com"]),
+            {
+                "Name": "example.com.",
+                "Type": "MX",
+                "TTL": 300,
+                "ResourceRecords": [{"Value": "10 mail.example.com"}],
+            },
+        ),
+    ],
+)
+def test_get_record_set(record: DnsRecord, expected: Dict[str, Any]) -> None:
+    """Test each record type serializes to the Route 53 API format."""
+    assert record.get_record_set() == expected
+
+
+@pytest.mark.parametrize(
+    "record_class, kwargs, message",
+    [
+        (ARecord, {}, "Must specify either values or alias_target"),
+        (
+            AAAARecord,
+            {"values": ["2001:db8::1"], "alias_target": ALIAS},
+            "Cannot specify both values and alias_target",
+        ),
+        (CNAMERecord, {}, "CNAME record requires a value"),
+        (CNAMERecord, {"values": ["a.", "b."]}, "can only have one value"),
+        (MXRecord, {"values": []}, "MX record requires at least one value"),
+        (TXTRecord, {}, "TXT record requires at least one value"),
+    ],
+)
+def test_invalid_records(
+    record_class: Callable[..., DnsRecord], kwargs: Dict[str, Any], message: str
+) -> None:
+    """Test records missing or mixing their values are rejected."""
+    with pytest.raises(ValueError, match=message):
+        record_class(name="example.com.", **kwargs)
+
+
+@pytest.mark.parametrize(
+    "record_type, record_class",
+    [("A", ARecord), ("aaaa", AAAARecord), ("Cname", CNAMERecord)],
+)
+def test_create_record(record_type: str, record_class: Type[DnsRecord]) -> None:
+    """Test the RECORD_TYPES lookup ignores the case of the type."""
+    record = create_record(record_type, name="example.com.", values=["value"])
+
+    assert type(record) is record_class
+    assert set(RECORD_TYPES) == {"A", "AAAA", "CNAME", "MX", "TXT"}
+
+
+def test_create_record_unknown_type() -> None:
+    """Test an unsupported record type is rejected."""
+    with pytest.raises(ValueError, match="Unknown record type: SRV"):
+        create_record("srv", name="example.com.", values=["0 5 5060 sip."])
@@ -1,33 +1,54 @@
 """Tests for Route53Operations update functionality."""
 
-from typing import Any
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
 
-import boto3
 import pytest
-from moto import mock_aws
 
-from src.route53_operations import Route53Operations
-from src.utils.error_handling import Route53NotFoundError, Route53ValidationError
+from src.route53_operations import ChangeRef, Route53Operations
+from src.utils.error_handling import (
+    Route53Error,
+    Route53NotFoundError,
+    Route53ValidationError,
+)
 
+if TYPE_CHECKING:
+    import boto3
+    from moto.core.models import MockAWS
 
-@pytest.fixture
-def route53_client() -> Any:
-    """Provide a mocked Route53 client."""
-    with mock_aws():
-        session = boto3.Session(region_name="us-east-1")
-        yield session.client("route53")
 
+def _names_by_type(record_sets: Iterable[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Group record names by record type in a single pass."""
+    names: Dict[str, List[str]] = defaultdict(list)
+    for record_set in record_sets:
+        names[record_set["Type"]].append(record_set["Name"])
+    return names
 
-@pytest.fixture
-def hosted_zone_with_records(route53_client: Any) -> str:
-    """Create a test hosted zone with existing records."""
+
+@pytest.fixture(scope="module")
+def route53_client(aws_mock: "MockAWS", boto_session: "boto3.Session") -> Any:
+    """Provide a mocked Route53 client whose account is shared by the module."""
+    # Reset once for the module instead of per test, so the zone below can be
+    # built once; tests that add records use their own hosted_zone
+    aws_mock.reset()
+    return boto_session.client("route53")
+
+
+@pytest.fixture(scope="module")
+def operations(route53_client: Any) -> Route53Operations:
+    """Share one Route53Operations across the module; it holds no test state."""
+    return Route53Operations(route53_client)
+
+
+@pytest.fixture(scope="module")
+def hosted_zone_with_records(route53_client: Any, operations: Route53Operations) -> str:
+    """Create a test hosted zone with existing records; tests must not modify it."""
     hosted_zone = route53_client.create_hosted_zone(
         Name="example.com", CallerReference="test-update"
     )
     zone_id = hosted_zone["HostedZone"]["Id"].split("/")[-1]
 
     # Create initial records
-    operations = Route53Operations(route53_client)
     operations.create_dns_record(
         hosted_zone_id=zone_id,
         domain="example.com",
@@ -42,63 +63,110 @@ class TestRoute53OperationsUpdate:
     """Test cases for Route53Operations update functionality."""
 
     def test_list_records_success(
-        self, route53_client: Any, hosted_zone_with_records: str
+        self, operations: Route53Operations, hosted_zone_with_records: str
     ) -> None:
         """Test successful listing of DNS records."""
-        operations = Route53Operations(route53_client)
-
         records = operations.list_records(hosted_zone_with_records)
 
         # Should have at least NS, SOA, and our A records
         assert len(records) >= 4
 
         # Check our created A records exist
-        a_records = [r for r in records if r["Type"] == "A"]
-        assert len(a_records) == 2
+        names = _names_by_type(records)
+        assert sorted(names["A"]) == ["api.example.com.", "web.example.com."]
 
-        record_names = [r["Name"] for r in a_records]
-        assert "api.example.com." in record_names
-        assert "web.example.com." in record_names
-
-    def test_list_records_empty_zone(self, route53_client: Any) -> None:
+    def test_list_records_empty_zone(
+        self, route53_client: Any, operations: Route53Operations
+    ) -> None:
         """Test listing records in empty hosted zone."""
         hosted_zone = route53_client.create_hosted_zone(
             Name="empty.com", CallerReference="test-empty"
         )
         zone_id = hosted_zone["HostedZone"]["Id"].split("/")[-1]
 
-        operations = Route53Operations(route53_client)
         records = operations.list_records(zone_id)
 
         # Should have default NS and SOA records
         assert len(records) >= 2
-        record_types = [r["Type"] for r in records]
-        assert "NS" in record_types
-        assert "SOA" in record_types
+        names = _names_by_type(records)
+        assert "NS" in names
+        assert "SOA" in names
 
-    def test_list_records_invalid_zone_id(self, route53_client: Any) -> None:
+    def test_list_records_invalid_zone_id(self, operations: Route53Operations) -> None:
         """Test listing records with invalid zone ID."""
-        operations = Route53Operations(route53_client)
-
         with pytest.raises(Route53ValidationError, match="Invalid hosted zone ID"):
             operations.list_records("invalid-zone")
 
-    def test_list_records_nonexistent_zone(self, route53_client: Any) -> None:
+    def test_list_records_nonexistent_zone(self, operations: Route53Operations) -> None:
         """Test listing records for non-existent zone."""
-        operations = Route53Operations(route53_client)
-
         with pytest.raises(Route53NotFoundError):
             operations.list_records("Z1234567890123")
 
+    def test_list_records_follows_pagination(
+        self,
+        route53_client: Any,
+        operations: Route53Operations,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test list_records returns records from every page."""
+        hosted_zone = route53_client.create_hosted_zone(
+            Name="paged.com", CallerReference="test-paged"
+        )
+        zone_id = hosted_zone["HostedZone"]["Id"].split("/")[-1]
+        monkeypatch.setattr("src.route53_operations.RECORDS_PAGE_SIZE", 2)
+
+        operations.create_dns_record(
+            hosted_zone_id=zone_id,
+            domain="paged.com",
+            load_balancer_ip="10.0.0.1",
+            services=["a", "b", "c", "d", "e"],
+        )
+
+        records = operations.list_records(zone_id)
+
+        # 5 A records plus the zone's NS and SOA records
+        assert len(records) == 7
+
+    def test_iter_records(
+        self, operations: Route53Operations, hosted_zone_with_records: str
+    ) -> None:
+        """Test lazily iterating over the records of a zone."""
+        records = list(operations.iter_records(hosted_zone_with_records))
+
+        assert records == operations.list_records(hosted_zone_with_records)
+
+    def test_iter_records_invalid_zone_id(self, operations: Route53Operations) -> None:
+        """Test that an invalid zone ID fails before iteration starts."""
+        with pytest.raises(Route53ValidationError, match="Invalid hosted zone ID"):
+            operations.iter_records("invalid-zone")
+
+    def test_list_records_many(
+        self,
+        route53_client: Any,
+        operations: Route53Operations,
+        hosted_zone_with_records: str,
+    ) -> None:
+        """Test listing records of several zones at once."""
+        hosted_zone = route53_client.create_hosted_zone(
+            Name="other.com", CallerReference="test-many"
+        )
+        other_zone_id = hosted_zone["HostedZone"]["Id"].split("/")[-1]
+
+        results = operations.list_records_many(
+            [hosted_zone_with_records, other_zone_id]
+        )
+
+        assert list(results) == [hosted_zone_with_records, other_zone_id]
+        assert len(_names_by_type(results[hosted_zone_with_records])["A"]) == 2
+        assert "A" not in _names_by_type(results[other_zone_id])
+
     def test_get_change_status_success(
-        self, route53_client: Any, hosted_zone_with_records: str
+        self, operations: Route53Operations, hosted_zone: str
     ) -> None:
         """Test successful change status retrieval."""
-        operations = Route53Operations(route53_client)
-
         # Create a change to get a change ID
         change_id = operations.create_dns_record(
-            hosted_zone_id=hosted_zone_with_records,
+            hosted_zone_id=hosted_zone,
             domain="example.com",
             load_balancer_ip="192.168.1.200",
             services=["test"],
@@ -110,28 +178,95 @@ class TestRoute53OperationsUpdate:
         # In moto, changes are typically INSYNC immediately
         assert status in ["PENDING", "INSYNC"]
 
-    def test_get_change_status_invalid_format(self, route53_client: Any) -> None:
-        """Test change status with invalid change ID format."""
-        operations = Route53Operations(route53_client)
+    def test_change_ref(self, operations: Route53Operations, hosted_zone: str) -> None:
+        """Test polling a change through the returned ChangeRef."""
+        change = operations.create_dns_record(
+            hosted_zone_id=hosted_zone,
+            domain="example.com",
+            load_balancer_ip="192.168.1.200",
+            services=["test"],
+        )
+
+        assert str(change) == change.id
+        assert change.status() in ["PENDING", "INSYNC"]
+        assert change.wait() == "INSYNC"
+
+    def test_change_ref_equality(self, operations: Route53Operations) -> None:
+        """Test references to one change are equal whenever they were made."""
+        first = ChangeRef("/change/C123", 1.0, operations)
+
+        assert first == ChangeRef("/change/C123", 2.0, operations)
+        assert first != ChangeRef("/change/C456", 1.0, operations)
+        assert hash(first) == hash(ChangeRef("/change/C123", 2.0, operations))
+
+    def test_iter_change_statuses(
+        self, operations: Route53Operations, hosted_zone: str
+    ) -> None:
+        """Test checking several changes at once."""
+        change_ids = [
+            operations.create_dns_record(
+                hosted_zone_id=hosted_zone,
+                domain="example.com",
+                load_balancer_ip="192.168.1.200",
+                services=[service],
+            )
+            for service in ("one", "two")
+        ]
+
+        statuses = dict(operations.iter_change_statuses(change_ids))
+
+        assert set(statuses) == set(change_ids)
+        assert all(status in ["PENDING", "INSYNC"] for status in statuses.values())
+        assert list(operations.iter_change_statuses([])) == []
+
+    def test_wait_for_change(
+        self, operations: Route53Operations, hosted_zone: str
+    ) -> None:
+        """Test waiting for a change to propagate."""
+        change_id = operations.create_dns_record(
+            hosted_zone_id=hosted_zone,
+            domain="example.com",
+            load_balancer_ip="192.168.1.200",
+            services=["test"],
+        )
+
+        assert operations.wait_for_change(change_id) == "INSYNC"
+
+    def test_wait_for_change_timeout(
+        self, operations: Route53Operations, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test waiting for a change that never propagates."""
+        monkeypatch.setattr(
+            Route53Operations, "get_change_status", lambda self, _: "PENDING"
+        )
+        monkeypatch.setattr("src.route53_operations.CHANGE_POLL_BASE_DELAY", 0.01)
+
+        with pytest.raises(Route53Error, match="Timed out"):
+            operations.wait_for_change("/change/C123", timeout=0.05)
 
+    def test_get_change_status_invalid_format(
+        self, operations: Route53Operations
+    ) -> None:
+        """Test change status with invalid change ID format."""
         with pytest.raises(Route53ValidationError, match="Invalid change ID format"):
             operations.get_change_status("invalid-change-id")
 
-    def test_get_change_status_nonexistent_change(self, route53_client: Any) -> None:
+    def test_get_change_status_nonexistent_change(
+        self, operations: Route53Operations
+    ) -> None:
         """Test change status for non-existent change."""
-        operations = Route53Operations(route53_client)
-
         with pytest.raises(Route53NotFoundError):
             operations.get_change_status("/change/C1234567890123")
 
-    def test_create_dns_record_multiple_services(self, route53_client: Any) -> None:
+    def test_create_dns_record_multiple_services(
+        self, route53_client: Any, operations: Route53Operations
+    ) -> None:
         """Test creating DNS records for multiple services."""
         hosted_zone = route53_client.create_hosted_zone(
             Name="multi.com", CallerReference="test-multi"
         )
         zone_id = hosted_zone["HostedZone"]["Id"].split("/")[-1]
 
-        operations = Route53Operations(route53_client)
         change_id = operations.create_dns_record(
             hosted_zone_id=zone_id,
             domain="multi.com",
@@ -139,30 +274,32 @@ class TestRoute53OperationsUpdate:
             services=["api", "web", "admin"],
         )
 
-        assert change_id.startswith("/change/")
+        assert str(change_id).startswith("/change/")
 
         # Verify all records were created
         records = route53_client.list_resource_record_sets(HostedZoneId=zone_id)
-        a_records = [r for r in records["ResourceRecordSets"] if r["Type"] == "A"]
-
-        assert len(a_records) == 3
-        record_names = [r["Name"] for r in a_records]
-        assert "api.multi.com." in record_names
-        assert "web.multi.com." in record_names
-        assert "admin.multi.com." in record_names
+        record_sets = records["ResourceRecordSets"]
+        assert sorted(_names_by_type(record_sets)["A"]) == [
+            "admin.multi.com.",
+            "api.multi.com.",
+            "web.multi.com.",
+        ]
 
         # Verify IP addresses
-        for record in a_records:
-            assert record["ResourceRecords"][0]["Value"] == "10.0.0.1"
+        values = {
+            r["ResourceRecords"][0]["Value"] for r in record_sets if r["Type"] == "A"
+        }
+        assert values == {"10.0.0.1"}
 
-    def test_create_dns_record_duplicate_services(self, route53_client: Any) -> None:
+    def test_create_dns_record_duplicate_services(
+        self, route53_client: Any, operations: Route53Operations
+    ) -> None:
         """Test creating DNS records with duplicate service names."""
         hosted_zone = route53_client.create_hosted_zone(
             Name="dup.com", CallerReference="test-dup"
         )
         zone_id = hosted_zone["HostedZone"]["Id"].split("/")[-1]
 
-        operations = Route53Operations(route53_client)
         change_id = operations.create_dns_record(
             hosted_zone_id=zone_id,
             domain="dup.com",
@@ -170,13 +307,9 @@ class TestRoute53OperationsUpdate:
             services=["api", "api", "web", "api"],  # Duplicates
         )
 
-        assert change_id.startswith("/change/")
+        assert str(change_id).startswith("/change/")
 
         # Verify only unique records were created
         records = route53_client.list_resource_record_sets(HostedZoneId=zone_id)
-        a_records = [r for r in records["ResourceRecordSets"] if r["Type"] == "A"]
-
-        assert len(a_records) == 2  # Only api and web
-        record_names = [r["Name"] for r in a_records]
-        assert "api.dup.com." in record_names
-        assert "web.dup.com." in record_names
+        names = _names_by_type(records["ResourceRecordSets"])
+        assert sorted(names["A"]) == ["api.dup.com.", "web.dup.com."]